@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Adaptive Sampler - threshold yaqinida tezlashadi, tinch paytda sekinlashadi
+"""
+
+import time
+
+IDLE = 'idle'
+ACTIVE = 'active'
+
+# Threshold nomlari (config.json) -> metrika
+METRIC_THRESHOLDS = {
+    'cpu': 'cpu_percent',
+    'memory': 'memory_percent',
+    'disk': 'disk_percent'
+}
+
+
+class AdaptiveSampler:
+    def __init__(self, min_interval=1, max_interval=10, near_ratio=0.8,
+                 fast_change=10, idle_scan_interval=60, active_hold=30):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.near_ratio = near_ratio
+        self.fast_change = fast_change
+        self.idle_scan_interval = idle_scan_interval
+        self.active_hold = active_hold
+
+        self.mode = ACTIVE
+        self.interval = min_interval
+        self.active_until = 0
+        self.last_scan = 0
+        self.previous = {}
+
+    def configure(self, options):
+        """config.json 'sampling' bo'limidan sozlash"""
+        for key in ('min_interval', 'max_interval', 'near_ratio', 'fast_change',
+                    'idle_scan_interval', 'active_hold'):
+            if key in options:
+                setattr(self, key, options[key])
+        self.interval = min(max(self.interval, self.min_interval), self.max_interval)
+
+    def update(self, values, thresholds):
+        """Yangi o'lchov bo'yicha rejim va intervalni yangilash"""
+        now = time.time()
+
+        triggered = False
+        for metric, threshold_key in METRIC_THRESHOLDS.items():
+            value = values.get(metric)
+            threshold = thresholds.get(threshold_key)
+            if value is None:
+                continue
+
+            # Threshold yaqinida yoki undan oshgan
+            if threshold is not None and value >= threshold * self.near_ratio:
+                triggered = True
+
+            # Tez o'zgarish
+            previous = self.previous.get(metric)
+            if previous is not None and abs(value - previous) >= self.fast_change:
+                triggered = True
+
+            self.previous[metric] = value
+
+        if triggered:
+            self.active_until = now + self.active_hold
+
+        if now < self.active_until:
+            self.mode = ACTIVE
+            self.interval = self.min_interval
+        else:
+            # Tinch - intervalni asta-sekin oshiramiz
+            self.mode = IDLE
+            self.interval = min(self.interval * 2, self.max_interval)
+
+        return self.mode
+
+    def hold_active(self):
+        """Tashqi sabab (masalan, watchlist buzilishi) - faol rejimni ushlab turish"""
+        self.active_until = time.time() + self.active_hold
+        self.mode = ACTIVE
+        self.interval = self.min_interval
+
+    def should_scan_processes(self):
+        """To'liq process skanerlash kerakmi?"""
+        now = time.time()
+        if self.mode == ACTIVE or now - self.last_scan >= self.idle_scan_interval:
+            self.last_scan = now
+            return True
+        return False
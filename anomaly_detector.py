@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Anomaly Detector - har bir metrikaning normal darajasini o'rganish
+
+EWMA o'rtacha/dispersiya va hafta kuni + soat bo'yicha seasonal baseline
+NumPy massivlarda saqlanadi. Namunalar daqiqalik o'rtachaga yig'iladi;
+har bir namuna O(1), daqiqa almashganda bitta vektor yangilanish.
+
+    python3 anomaly_detector.py rebuild --model anomaly_model.npz
+"""
+
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+
+METRICS = ('cpu', 'memory', 'disk')
+
+# Hafta kuni (0=Dushanba) * 24 + soat
+SLOTS = 7 * 24
+
+# Bir haftalik daqiqalik tarix (rebuild uchun)
+HISTORY_MINUTES = 7 * 24 * 60
+
+
+def week_ids(timestamps, utc_offset):
+    """Unix vaqt(lar) -> hafta raqami (Dushanbadan boshlanadi)"""
+    local = np.asarray(timestamps, dtype=np.float64) + utc_offset
+    days = np.floor(local / 86400).astype(np.int64)
+    return (days + 3) // 7
+
+
+def time_slots(timestamps, utc_offset):
+    """Unix vaqt(lar) -> seasonal slot (vektorlashtirilgan)"""
+    local = np.asarray(timestamps, dtype=np.float64) + utc_offset
+    days = np.floor(local / 86400).astype(np.int64)
+    # 1970-01-01 - payshanba (3)
+    weekday = (days + 3) % 7
+    hour = ((local - days * 86400) // 3600).astype(np.int64)
+    return weekday * 24 + hour
+
+
+class AnomalyDetector:
+    def __init__(self, metrics=METRICS, alpha=0.05, var_alpha=0.01, seasonal_alpha=0.02, z_threshold=4.0,
+                 min_samples=60, seasonal_min_samples=30, seasonal_min_weeks=2, min_std=1.0):
+        self.metrics = tuple(metrics)
+        self.alpha = alpha
+        # Dispersiya sekinroq o'rganiladi - qisqa oynadagi baho shovqinli, z ni oshirib yuboradi
+        self.var_alpha = var_alpha
+        self.seasonal_alpha = seasonal_alpha
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        self.seasonal_min_samples = seasonal_min_samples
+        self.seasonal_min_weeks = seasonal_min_weeks
+        self.min_std = min_std
+        self.utc_offset = time.localtime().tm_gmtoff
+
+        m = len(self.metrics)
+
+        # EWMA baseline
+        self.mean = np.zeros(m)
+        self.var = np.zeros(m)
+        self.count = 0
+
+        # Seasonal baseline: [metrika, slot]
+        self.seasonal_mean = np.zeros((m, SLOTS))
+        self.seasonal_var = np.zeros((m, SLOTS))
+        self.seasonal_count = np.zeros((m, SLOTS), dtype=np.int64)
+
+        # Slot nechta turli haftada ko'rilgan - bitta kunlik ma'lumot seasonal emas
+        self.seasonal_weeks = np.zeros(SLOTS, dtype=np.int64)
+        self.seasonal_last_week = np.full(SLOTS, -1, dtype=np.int64)
+
+        # Daqiqalik tarix (ring buffer)
+        self.history = np.full((HISTORY_MINUTES, m), np.nan)
+        self.history_time = np.zeros(HISTORY_MINUTES)
+
+        # Joriy daqiqa yig'indisi
+        self.minute = None
+        self.minute_sum = np.zeros(m)
+        self.minute_samples = 0
+
+    def update(self, values, ts=None):
+        """
+        Yangi namuna (dict: metrika -> qiymat)
+
+        Daqiqa tugaganda anomaliyalar ro'yxatini qaytaradi, aks holda [].
+        """
+        ts = ts or time.time()
+        minute = int(ts // 60)
+
+        anomalies = []
+        if self.minute is not None and minute != self.minute and self.minute_samples:
+            anomalies = self._close_minute()
+
+        if self.minute != minute:
+            self.minute = minute
+            self.minute_sum[:] = 0
+            self.minute_samples = 0
+
+        for i, metric in enumerate(self.metrics):
+            self.minute_sum[i] += values.get(metric, 0)
+        self.minute_samples += 1
+
+        return anomalies
+
+    def _close_minute(self):
+        """Daqiqalik o'rtachani baholash va modellarni yangilash"""
+        x = self.minute_sum / self.minute_samples
+        ts = self.minute * 60
+        slot = int(time_slots(ts, self.utc_offset))
+
+        # Baholash - seasonal baseline yetarli bo'lsa u, aks holda EWMA
+        seasonal_ready = (
+            (self.seasonal_count[:, slot] >= self.seasonal_min_samples)
+            & (self.seasonal_weeks[slot] >= self.seasonal_min_weeks)
+        )
+        expected = np.where(seasonal_ready, self.seasonal_mean[:, slot], self.mean)
+        variance = np.where(seasonal_ready, self.seasonal_var[:, slot], self.var)
+        std = np.maximum(np.sqrt(variance), self.min_std)
+        z = (x - expected) / std
+
+        anomalies = []
+        if self.count >= self.min_samples:
+            for i in np.nonzero(np.abs(z) > self.z_threshold)[0]:
+                anomalies.append({
+                    'metric': self.metrics[i],
+                    'value': round(float(x[i]), 1),
+                    'expected': round(float(expected[i]), 1),
+                    'std': round(float(std[i]), 1),
+                    'z': round(float(z[i]), 1),
+                    'baseline': 'seasonal' if seasonal_ready[i] else 'ewma'
+                })
+
+        # EWMA yangilash. alpha = max(alpha, 1/n): isinish davrida bu Welford
+        # (aniq o'rtacha/dispersiya), keyin oddiy EWMA - 0 dan boshlangan
+        # dispersiya pastga siljimaydi
+        alpha = max(self.alpha, 1.0 / (self.count + 1))
+        var_alpha = max(self.var_alpha, 1.0 / (self.count + 1))
+        diff = x - self.mean
+        self.mean += alpha * diff
+        self.var = (1 - var_alpha) * (self.var + var_alpha * diff * diff)
+        self.count += 1
+
+        # Seasonal yangilash (slot ustuni) - xuddi shu usulda
+        alpha = np.maximum(self.seasonal_alpha, 1.0 / (self.seasonal_count[:, slot] + 1))
+        diff = x - self.seasonal_mean[:, slot]
+        increment = alpha * diff
+        self.seasonal_mean[:, slot] += increment
+        self.seasonal_var[:, slot] = (1 - alpha) * (self.seasonal_var[:, slot] + diff * increment)
+        self.seasonal_count[:, slot] += 1
+
+        week = int(week_ids(ts, self.utc_offset))
+        if week != self.seasonal_last_week[slot]:
+            self.seasonal_last_week[slot] = week
+            self.seasonal_weeks[slot] += 1
+
+        # Tarix
+        row = self.minute % HISTORY_MINUTES
+        self.history[row] = x
+        self.history_time[row] = ts
+
+        return anomalies
+
+    def rebuild(self):
+        """Bir haftalik tarixdan baseline'larni bitta vektorlashtirilgan o'tishda qayta qurish"""
+        valid = self.history_time > 0
+        if not valid.any():
+            return
+
+        order = np.argsort(self.history_time[valid])
+        times = self.history_time[valid][order]
+        values = self.history[valid][order]
+        n, m = values.shape
+
+        # Seasonal: metrika*SLOTS + slot bo'yicha bitta bincount
+        slots = time_slots(times, self.utc_offset)
+        index = (np.arange(m)[None, :] * SLOTS + slots[:, None]).ravel()
+        flat = values.ravel()
+        counts = np.bincount(index, minlength=m * SLOTS).reshape(m, SLOTS)
+        sums = np.bincount(index, weights=flat, minlength=m * SLOTS).reshape(m, SLOTS)
+        squares = np.bincount(index, weights=flat * flat, minlength=m * SLOTS).reshape(m, SLOTS)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(counts > 0, sums / counts, 0.0)
+            var = np.where(counts > 0, squares / counts - mean * mean, 0.0)
+
+        self.seasonal_mean = mean
+        self.seasonal_var = np.maximum(var, 0.0)
+        self.seasonal_count = counts.astype(np.int64)
+
+        # Tarix bir haftalik - avval to'plangan haftalar soni saqlanadi
+        weeks = week_ids(times, self.utc_offset)
+        last_week = np.full(SLOTS, -1, dtype=np.int64)
+        np.maximum.at(last_week, slots, weeks)
+        pairs = np.unique(np.stack([slots, weeks], axis=1), axis=0)
+        seen = np.bincount(pairs[:, 0], minlength=SLOTS)
+        self.seasonal_weeks = np.maximum(self.seasonal_weeks, seen)
+        self.seasonal_last_week = np.maximum(self.seasonal_last_week, last_week)
+
+        # EWMA: yakuniy holat og'irliklar yig'indisi sifatida
+        def ewma(alpha, series):
+            weights = alpha * (1 - alpha) ** np.arange(n - 1, -1, -1)
+            return weights @ series + (1 - alpha) ** n * series[0]
+
+        self.mean = ewma(self.alpha, values)
+        variance_mean = ewma(self.var_alpha, values)
+        self.var = np.maximum(ewma(self.var_alpha, values * values) - variance_mean ** 2, 0.0)
+        self.count = n
+
+    def save(self, path):
+        """Modelni faylga saqlash (atomik)"""
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            metrics=np.array(self.metrics),
+            mean=self.mean, var=self.var, count=self.count,
+            seasonal_mean=self.seasonal_mean, seasonal_var=self.seasonal_var,
+            seasonal_count=self.seasonal_count,
+            seasonal_weeks=self.seasonal_weeks, seasonal_last_week=self.seasonal_last_week,
+            history=self.history, history_time=self.history_time
+        )
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        """Saqlangan modelni yuklash"""
+        with np.load(path) as data:
+            if tuple(data['metrics']) != self.metrics:
+                raise ValueError(f"Model metrikalari mos emas: {tuple(data['metrics'])}")
+            self.mean = data['mean']
+            self.var = data['var']
+            self.count = int(data['count'])
+            self.seasonal_mean = data['seasonal_mean']
+            self.seasonal_var = data['seasonal_var']
+            self.seasonal_count = data['seasonal_count']
+            # Eski modellarda haftalar hisobi yo'q - seasonal qaytadan isinadi
+            if 'seasonal_weeks' in data.files:
+                self.seasonal_weeks = data['seasonal_weeks']
+                self.seasonal_last_week = data['seasonal_last_week']
+            self.history = data['history']
+            self.history_time = data['history_time']
+
+    @classmethod
+    def load_or_create(cls, path, **options):
+        """Fayl mavjud bo'lsa yuklash, aks holda yangi model"""
+        detector = cls(**options)
+        if os.path.exists(path):
+            try:
+                detector.load(path)
+                logging.info(f"📈 Anomaly model yuklandi: {path}")
+            except Exception as e:
+                logging.error(f"❌ Anomaly model yuklashda xato: {e}")
+                detector = cls(**options)
+        return detector
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Anomaly model")
+    parser.add_argument('command', choices=['rebuild', 'show'])
+    parser.add_argument('--model', default='anomaly_model.npz')
+    args = parser.parse_args()
+
+    detector = AnomalyDetector.load_or_create(args.model)
+
+    if args.command == 'rebuild':
+        started = time.perf_counter()
+        detector.rebuild()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        detector.save(args.model)
+        print(f"✅ Baseline qayta qurildi: {detector.count} daqiqa, {elapsed_ms:.1f} ms")
+
+    slot = int(time_slots(time.time(), detector.utc_offset))
+    for i, metric in enumerate(detector.metrics):
+        print(f"{metric:<8} EWMA {detector.mean[i]:6.1f} ± {np.sqrt(detector.var[i]):5.1f} | "
+              f"seasonal {detector.seasonal_mean[i, slot]:6.1f} ± {np.sqrt(detector.seasonal_var[i, slot]):5.1f} "
+              f"(n={detector.seasonal_count[i, slot]}, weeks={detector.seasonal_weeks[slot]})")
+
+
+if __name__ == "__main__":
+    main()
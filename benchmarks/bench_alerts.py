@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark - alert yo'li: _process_metrics dan soxta Bot API gacha end-to-end latency
+
+    python3 benchmarks/bench_alerts.py --count 50 --delay 0.2
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fake_services import FakeHTTPServer
+
+
+def _config(bot_url, work_dir):
+    return {
+        'telegram': {'bot_token': 'BENCH', 'chat_id': '1'},
+        'notifiers': [{'type': 'telegram', 'api_url': bot_url, 'timeout': 10, 'retries': 0}],
+        'thresholds': {'cpu_percent': 50, 'memory_percent': 101, 'disk_percent': 101},
+        'alert_cooldown': 0,
+        'alert_drilldown': False,
+        'watchlist': [],
+        'disk_forecast': {'enabled': False},
+        'anomaly': {'enabled': False},
+        'incidents': {'db_path': os.path.join(work_dir, 'incidents.db')},
+        'logging': {'async': True}
+    }
+
+
+def _synthetic_metrics():
+    processes = [{'pid': 1000 + i, 'name': f'proc-{i}', 'cpu': 90.0 - i} for i in range(5)]
+    return {
+        'cpu': 95.0, 'memory': 40.0, 'disk': 50.0,
+        'memory_total_gb': 64.0, 'memory_used_gb': 25.6,
+        'disk_total_gb': 500.0, 'disk_used_gb': 250.0,
+        'top_cpu_processes': processes,
+        'top_memory_processes': [{'pid': p['pid'], 'name': p['name'], 'memory_mb': 512.0} for p in processes],
+        'timestamp': time.time()
+    }
+
+
+def run(count=50, delay=0.0):
+    """count ta CPU alert yuborib latency o'lchash - natija dict"""
+    work_dir = tempfile.mkdtemp(prefix='bench_alerts_')
+    bot = FakeHTTPServer(delay=delay).start()
+
+    with open(os.path.join(work_dir, 'config.json'), 'w') as f:
+        json.dump(_config(bot.url, work_dir), f)
+
+    # main_with_socket import paytida logging (logs/, config.json) sozlaydi - vaqtinchalik papkada
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        from main_with_socket import SocketMonitoringIntegration
+
+        monitor = SocketMonitoringIntegration(os.path.join(work_dir, 'config.json'))
+        monitor.incident_store.start()
+
+        call_times = []
+        latencies = []
+        for i in range(count):
+            started = time.time()
+            monitor._process_metrics(_synthetic_metrics())
+            call_times.append(time.time() - started)
+
+            # Soxta Bot API xabarni olguncha kutish
+            wait_until = time.time() + 10 + delay
+            while len(bot.received) <= i and time.time() < wait_until:
+                time.sleep(0.001)
+            if len(bot.received) > i:
+                latencies.append(bot.received[i]['time'] - started)
+
+        monitor.incident_store.stop()
+        monitor.notifier.close()
+    finally:
+        os.chdir(previous_dir)
+        bot.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'benchmark': 'alerts',
+        'count': count,
+        'bot_api_delay_s': delay,
+        'delivered': len(latencies),
+        'process_metrics_p50_ms': round(statistics.median(call_times) * 1000, 2),
+        'end_to_end_p50_ms': round(statistics.median(latencies) * 1000, 2) if latencies else None,
+        'end_to_end_max_ms': round(max(latencies) * 1000, 2) if latencies else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alert path benchmark")
+    parser.add_argument('--count', type=int, default=50)
+    parser.add_argument('--delay', type=float, default=0.0, help="soxta Bot API javob kechikishi (s)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.count, args.delay), indent=2))
+
+
+if __name__ == "__main__":
+    main()
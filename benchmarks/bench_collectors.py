@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark - process collector'larini synthetic /proc ustida o'lchash
+
+    python3 benchmarks/bench_collectors.py --sizes 100 1000 10000 50000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bench_process_scan
+from process_records import ProcessTable
+from synthetic_proc import SyntheticProc
+from watchlist import Watchlist
+
+WATCH_RULES = [
+    {'name': 'postgres-rss', 'match': '^postgres$', 'metric': 'memory_mb', 'threshold': 20480},
+    {'name': 'java-cpu', 'match': '^java$', 'metric': 'cpu', 'threshold': 400},
+    {'name': 'worker-cmdline', 'match': '--worker', 'field': 'cmdline', 'metric': 'cpu', 'threshold': 90}
+]
+
+
+def _median_ms(timings):
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def bench_size(count, repeat, workers):
+    """Bitta jadval o'lchami uchun barcha collectorlar"""
+    fixture = SyntheticProc(count)
+    try:
+        table = ProcessTable(proc_root=fixture.root)
+        watchlist = Watchlist(WATCH_RULES)
+        table.scan()
+
+        scan, top, watch = [], [], []
+        for _ in range(repeat):
+            fixture.tick()
+
+            start = time.perf_counter()
+            table.scan()
+            scan.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            table.top('cpu')
+            table.top('memory_mb')
+            top.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            watchlist.evaluate(
+                ((r.pid, r.start_time, r.name, r.cpu, r.memory_mb) for r in table.records.values()),
+                fixture.root
+            )
+            watch.append(time.perf_counter() - start)
+
+        parallel = bench_process_scan.run(fixture.root, workers, repeat, rules=WATCH_RULES)
+    finally:
+        fixture.cleanup()
+
+    return {
+        'processes': count,
+        'table_scan_ms': _median_ms(scan),
+        'table_scan_us_per_process': round(statistics.median(scan) * 1e6 / count, 3),
+        'top_n_ms': _median_ms(top),
+        'watchlist_ms': _median_ms(watch),
+        'serial_scan_ms': round(parallel['serial_median_s'] * 1000, 3),
+        'parallel_scan_ms': round(parallel['parallel_median_s'] * 1000, 3),
+        'parallel_speedup': parallel['speedup']
+    }
+
+
+def run(sizes=(100, 1000, 10000, 50000), repeat=5, workers=None):
+    """Barcha o'lchamlar bo'yicha natija dict"""
+    workers = workers or min(4, os.cpu_count() or 1)
+    return {
+        'benchmark': 'collectors',
+        'repeat': repeat,
+        'workers': workers,
+        'results': [bench_size(count, repeat, workers) for count in sizes]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collector benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sizes, args.repeat, args.workers), indent=2))
+
+
+if __name__ == "__main__":
+    main()
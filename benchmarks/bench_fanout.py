@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark - socket fan-out: yuzlab soxta consumer'lar bilan throughput va latency
+
+    python3 benchmarks/bench_fanout.py --clients 100 500 --duration 10 --interval 0.01
+
+Server synthetic o'lchovni har `interval` soniyada e'lon qiladi (0 - to'xtovsiz).
+Latency - e'lon qilingandan (metrika timestamp) consumer olguncha; delivery_ratio -
+consumer'lar olgan / e'lon qilingan * clientlar (sekin client oraliq namunalarni
+o'tkazib yuboradi). Consumer'lar shu process'da o'qiladi - katta yuklamada
+o'lchov o'z navbatida bench client'ni ham o'z ichiga oladi.
+"""
+
+import argparse
+import json
+import os
+import selectors
+import shutil
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from socket_server import MonitoringSocketServer
+
+
+def _synthetic_metrics():
+    processes = [{'pid': 1000 + i, 'name': f'proc-{i}', 'cpu': 10.0 - i} for i in range(5)]
+    return {
+        'cpu': 42.0, 'memory': 55.0, 'disk': 61.0,
+        'memory_total_gb': 64.0, 'memory_used_gb': 35.2,
+        'disk_total_gb': 500.0, 'disk_used_gb': 305.0,
+        'top_cpu_processes': processes,
+        'top_memory_processes': [{'pid': p['pid'], 'name': p['name'], 'memory_mb': 512.0} for p in processes],
+        'timestamp': time.time()
+    }
+
+
+class BenchmarkSocketServer(MonitoringSocketServer):
+    """Haqiqiy collector o'rniga synthetic metrika - faqat fan-out o'lchanadi"""
+
+    def __init__(self, socket_path, interval=0.01):
+        super().__init__(socket_path=socket_path)
+        self.interval = interval
+        self.published = []
+
+    def _monitor_loop(self):
+        while self.running:
+            metrics = _synthetic_metrics()
+            self._publish(metrics)
+            self.published.append(metrics['timestamp'])
+            # interval=0 da ham GIL'ni handler thread'larga bo'shatamiz
+            time.sleep(self.interval)
+
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def _timestamp(line):
+    """Payload oxiridagi timestamp (json.loads qilmasdan - consumer tomoni arzon bo'lsin)"""
+    return float(line[line.rindex(b'"timestamp": ') + 13:line.rindex(b'}')])
+
+
+def bench_clients(client_count, duration, interval=0.01):
+    """client_count ta consumer ulab, duration soniya o'qish"""
+    work_dir = tempfile.mkdtemp(prefix='bench_fanout_')
+    socket_path = os.path.join(work_dir, 'monitor.sock')
+    server = BenchmarkSocketServer(socket_path, interval)
+    server.start()
+
+    selector = selectors.DefaultSelector()
+    clients = []
+    connect_times = []
+    try:
+        for _ in range(client_count):
+            start = time.perf_counter()
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(socket_path)
+            connect_times.append(time.perf_counter() - start)
+            client.setblocking(False)
+            selector.register(client, selectors.EVENT_READ, [b""])
+            clients.append(client)
+
+        messages = 0
+        received_bytes = 0
+        latencies = []
+        window_start = time.time()
+        deadline = window_start + duration
+        while time.time() < deadline:
+            for key, _ in selector.select(timeout=0.1):
+                try:
+                    chunk = key.fileobj.recv(65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                    continue
+
+                now = time.time()
+                received_bytes += len(chunk)
+                buffer = key.data[0] + chunk
+                while b'\n' in buffer:
+                    line, buffer = buffer.split(b'\n', 1)
+                    # Ulanishdagi boshlang'ich namunalar o'lchov oynasiga kirmaydi
+                    timestamp = _timestamp(line)
+                    if not window_start <= timestamp < deadline:
+                        continue
+                    messages += 1
+                    latencies.append(now - timestamp)
+                key.data[0] = buffer
+        published = sum(1 for ts in list(server.published) if window_start <= ts < deadline)
+    finally:
+        for client in clients:
+            client.close()
+        selector.close()
+        server.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'clients': client_count,
+        'duration_s': duration,
+        'published_per_sec': round(published / duration, 1),
+        'messages': messages,
+        'messages_per_sec': round(messages / duration, 1),
+        'delivery_ratio': round(messages / (published * client_count), 3) if published else None,
+        'bytes_per_sec': round(received_bytes / duration),
+        'connect_p50_ms': round(statistics.median(connect_times) * 1000, 3) if connect_times else None,
+        'latency_p50_ms': round(_percentile(latencies, 0.5) * 1000, 2) if latencies else None,
+        'latency_p99_ms': round(_percentile(latencies, 0.99) * 1000, 2) if latencies else None
+    }
+
+
+def run(client_counts=(10, 100, 500), duration=5, interval=0.01):
+    """Barcha consumer sonlari bo'yicha natija dict"""
+    return {
+        'benchmark': 'fanout',
+        'publish_interval_s': interval,
+        'results': [bench_clients(count, duration, interval) for count in client_counts]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Socket fan-out benchmark")
+    parser.add_argument('--clients', type=int, nargs='+', default=[10, 100, 500])
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--interval', type=float, default=0.01, help="o'lchov e'lon qilish oralig'i (s)")
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.clients, args.duration, args.interval), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark - serial va parallel /proc skanerlash tezligini solishtirish
+
+    python3 benchmarks/bench_process_scan.py --workers 4 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel_scanner import ParallelProcessScanner, list_pids
+from process_records import ProcessTable
+from watchlist import Watchlist
+
+
+def bench_serial(proc_root, pids, limit, repeat, rules):
+    """Serial yo'l (socket_server bilan bir xil): ProcessTable.scan + top-N + watchlist"""
+    table = ProcessTable(proc_root=proc_root)
+    watchlist = Watchlist(rules)
+    table.scan(pids)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        table.scan(pids)
+        table.top('cpu', limit)
+        table.top('memory_mb', limit)
+        watchlist.evaluate(
+            ((r.pid, r.start_time, r.name, r.cpu, r.memory_mb) for r in table.records.values()),
+            proc_root
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_parallel(scanner, pids, limit, repeat, rules):
+    """Doimiy worker'lar bilan skanerlash"""
+    # Worker'larni ishga tushirish va holatini to'ldirish - o'lchovga kirmasin
+    scanner.scan(pids, limit=limit, rules=rules)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scanner.scan(pids, limit=limit, rules=rules)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(proc_root='/proc', workers=None, repeat=5, limit=5, rules=None):
+    """Serial va parallel skanerlashni solishtirish - natija dict"""
+    workers = workers or min(4, os.cpu_count() or 1)
+    pids = list_pids(proc_root)
+    scanner = ParallelProcessScanner(workers=workers, proc_root=proc_root)
+
+    try:
+        serial = bench_serial(proc_root, pids, limit, repeat, rules or [])
+        parallel = bench_parallel(scanner, pids, limit, repeat, rules or [])
+    finally:
+        scanner.close()
+
+    serial_median = statistics.median(serial)
+    parallel_median = statistics.median(parallel)
+
+    return {
+        'benchmark': 'process_scan',
+        'process_count': len(pids),
+        'workers': workers,
+        'repeat': repeat,
+        'serial_median_s': round(serial_median, 4),
+        'parallel_median_s': round(parallel_median, 4),
+        'speedup': round(serial_median / parallel_median, 2) if parallel_median else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process scan benchmark")
+    parser.add_argument('--proc-root', default='/proc')
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--limit', type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.proc_root, args.workers, args.repeat, args.limit), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Disk forecast - keskin sakrashlarda time-to-full bashoratini tekshirish
+
+    python3 benchmarks/check_disk_forecast.py
+
+Sintetik mount 2 MB/s o'sadi, keyin 10 GiB dump yoki 5 GiB o'chirish.
+Tekshiriladi: ETA haqiqiy joriy darajadan hisoblanadi va eski daraja
+slope'ni buzmaydi. Xato bo'lsa exit code 1.
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from disk_forecast import DiskForecaster
+
+GIB = 1024 ** 3
+RATE = 2 * 1024 * 1024
+STEP = 10
+HORIZON = 3600
+
+
+def simulate(free_start, jump, before=100, after=60, seed=1):
+    """
+    jump dan keyingi namunalar [(t, haqiqiy ETA, bashorat ETA, alert bo'ldimi)]
+    va oxirgi o'sish tezligi (bayt/s)
+    """
+    rng = random.Random(seed)
+    forecaster = DiskForecaster(horizon=HORIZON)
+    total = 500 * GIB
+    used = 100 * GIB
+    free = free_start
+    results = []
+    for i in range(before + after):
+        t = 1_000_000 + i * STEP
+        if i == before:
+            used += jump
+            free -= jump
+        else:
+            used += RATE * STEP
+            free -= RATE * STEP
+        noise = rng.randint(-256 * 1024, 256 * 1024)
+        disk = {'mount': '/data', 'total': total, 'used': used + noise,
+                'free': free - noise, 'percent': round((used + noise) / total * 100, 1)}
+        alerts = forecaster.update([disk], t)
+        if i >= before:
+            trend = forecaster.trends['/data']
+            predicted = trend.time_to_full(disk['used'] + disk['free'], disk['used'])
+            results.append((t, free / RATE, predicted, bool(alerts)))
+    fitted = forecaster.trends['/data'].fit()
+    return results, fitted[0] if fitted else None
+
+
+def _eta(seconds):
+    return f"{seconds:.0f}s" if seconds is not None else "bashorat yo'q"
+
+
+def _rate_ok(rate):
+    """Eski daraja slope'ni buzmagan - tezlik 5% ichida"""
+    return rate is not None and abs(rate - RATE) / RATE <= 0.05, f"{rate / 1024 / 1024:.2f} MB/s" if rate else None
+
+
+def _within(results, tolerance):
+    """Bashorat bor joyda haqiqiy ETA dan og'ish tolerance dan oshmaydi"""
+    errors = [abs(p - e) / e for _, e, p, _ in results if p is not None]
+    return bool(errors) and max(errors) <= tolerance, f"max xato {max(errors) * 100:.1f}%" if errors else "bashorat yo'q"
+
+
+def run():
+    """Barcha tekshiruvlar - [(nom, o'tdimi, tafsilot)]"""
+    checks = []
+
+    # Dump: ~13 GiB bo'sh -> ~3 GiB, haqiqiy ETA ~1500s (horizon ichida)
+    dump, rate = simulate(15 * GIB, 10 * GIB)
+    first = dump[0]
+    checks.append(('dump: darhol alert', first[3],
+                   f"haqiqiy {first[1]:.0f}s, bashorat {first[2]:.0f}s" if first[2] else "bashorat yo'q"))
+    checks.append(('dump: ETA aniq', *_within(dump, 0.15)))
+    checks.append(('dump: oxirida ETA bor', dump[-1][2] is not None, _eta(dump[-1][2])))
+    checks.append(('dump: tezlik', *_rate_ok(rate)))
+
+    # O'chirish: ~8 GiB bo'sh -> ~13 GiB, haqiqiy ETA ~6600s (horizon tashqarisida)
+    cleanup, rate = simulate(10 * GIB, -5 * GIB)
+    checks.append(('cleanup: yolg\'on alert yo\'q', not any(r[3] for r in cleanup),
+                   sum(r[3] for r in cleanup)))
+    checks.append(('cleanup: ETA aniq', *_within(cleanup, 0.15)))
+    checks.append(('cleanup: oxirida ETA bor', cleanup[-1][2] is not None, _eta(cleanup[-1][2])))
+    checks.append(('cleanup: tezlik', *_rate_ok(rate)))
+
+    return checks
+
+
+def main():
+    checks = run()
+    for name, passed, detail in checks:
+        print(f"{'✅' if passed else '❌'} {name:<26} {detail}")
+    sys.exit(0 if all(passed for _, passed, _ in checks) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Notifier kanallarini soxta webhook va SMTP serverlarga qarshi end-to-end tekshirish
+
+    python3 benchmarks/check_notifiers.py
+
+Tekshiriladi: yetkazish, severity routing va sekin kanal boshqalarni
+kechiktirmasligi. Xato bo'lsa exit code 1.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ConfigManager
+from fake_services import FakeHTTPServer, FakeSMTPServer
+from notifiers import MultiNotifier
+
+SLOW_DELAY = 3.0
+
+
+def _wait(server, count, timeout):
+    deadline = time.time() + timeout
+    while len(server.received) < count and time.time() < deadline:
+        time.sleep(0.01)
+    return len(server.received) >= count
+
+
+def run():
+    """Barcha tekshiruvlar - [(nom, o'tdimi, tafsilot)]"""
+    webhook = FakeHTTPServer().start()
+    slow_webhook = FakeHTTPServer(delay=SLOW_DELAY).start()
+    smtp = FakeSMTPServer().start()
+
+    work_dir = tempfile.mkdtemp(prefix='check_notifiers_')
+    config_file = os.path.join(work_dir, 'config.json')
+    with open(config_file, 'w') as f:
+        json.dump({'notifiers': [
+            {'type': 'webhook', 'name': 'webhook', 'url': f"{webhook.url}/hook", 'retries': 0},
+            {'type': 'webhook', 'name': 'slow-webhook', 'url': f"{slow_webhook.url}/hook",
+             'timeout': SLOW_DELAY * 2, 'retries': 0},
+            {'type': 'email', 'host': '127.0.0.1', 'port': smtp.port, 'to': 'ops@example.com',
+             'from': 'monitor@example.com', 'min_severity': 'critical', 'retries': 0}
+        ]}, f)
+    notifier = MultiNotifier.from_config(ConfigManager(config_file))
+
+    checks = []
+    try:
+        # info: ikkala webhook, email emas
+        started = time.time()
+        sent = notifier.send_message("<b>Test</b> info", severity='info')
+        elapsed = time.time() - started
+        checks.append(('info yuborildi', sent, f"{elapsed * 1000:.0f} ms"))
+        checks.append(('sekin kanal bloklamaydi', elapsed < SLOW_DELAY / 2, f"{elapsed * 1000:.0f} ms"))
+        checks.append(('webhook info oldi', _wait(webhook, 1, 5), len(webhook.received)))
+
+        payload = webhook.received[0]['payload'] if webhook.received else {}
+        checks.append(('webhook payload', payload.get('severity') == 'info' and payload.get('text') == 'Test info',
+                       json.dumps(payload, ensure_ascii=False)[:120]))
+
+        # critical: barcha kanallar
+        alert = {
+            'emoji': '🚨', 'severity': 'critical', 'title': 'CPU ALERT', 'date': '-',
+            'hostname': 'bench', 'ip': '127.0.0.1', 'uptime': '-',
+            'metrics': ['🔥 CPU: 97.0%'], 'processes': []
+        }
+        started = time.time()
+        sent = notifier.send_formatted_alert(alert)
+        elapsed = time.time() - started
+        checks.append(('critical yuborildi', sent, f"{elapsed * 1000:.0f} ms"))
+        checks.append(('email critical oldi', _wait(smtp, 1, 5), len(smtp.received)))
+        checks.append(('email subject', bool(smtp.received) and '[CRITICAL]' in smtp.received[0]['data'],
+                       smtp.received[0]['data'].splitlines()[0] if smtp.received else None))
+        checks.append(('webhook critical oldi', _wait(webhook, 2, 5), len(webhook.received)))
+
+        # Sekin kanal ham oxir-oqibat yetkazadi
+        checks.append(('sekin webhook yetkazdi', _wait(slow_webhook, 2, SLOW_DELAY * 3), len(slow_webhook.received)))
+        checks.append(('email info olmadi', len(smtp.received) == 1, len(smtp.received)))
+    finally:
+        notifier.close()
+        webhook.stop()
+        slow_webhook.stop()
+        smtp.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return checks
+
+
+def main():
+    checks = run()
+    for name, passed, detail in checks:
+        print(f"{'✅' if passed else '❌'} {name:<26} {detail}")
+    sys.exit(0 if all(passed for _, passed, _ in checks) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Fake services - notifier kanallarini lokal tekshirish uchun soxta serverlar
+
+FakeHTTPServer Telegram Bot API (/bot<token>/sendMessage) va JSON webhook
+o'rnida, FakeSMTPServer esa SMTP o'rnida ishlaydi. Har bir so'rov vaqti
+bilan `received` ro'yxatiga yoziladi.
+"""
+
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if server.delay:
+            time.sleep(server.delay)
+
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            payload = json.loads(body or b'{}')
+        else:
+            payload = {k: v[0] for k, v in parse_qs(body.decode('utf-8')).items()}
+
+        with server.lock:
+            server.received.append({'time': time.time(), 'path': self.path, 'payload': payload})
+
+        self.send_response(server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps({'ok': server.status == 200}).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeHTTPServer(ThreadingHTTPServer):
+    """Soxta Bot API / webhook: delay va status sozlanadi"""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.0, status=200):
+        super().__init__(('127.0.0.1', 0), _HTTPHandler)
+        self.delay = delay
+        self.status = status
+        self.received = []
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 fake-smtp ready")
+        message = None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+
+            if message is not None:
+                if command == '.':
+                    with self.server.lock:
+                        self.server.received.append({'time': time.time(), 'data': '\n'.join(message)})
+                    message = None
+                    self.reply("250 OK")
+                else:
+                    message.append(command)
+            elif verb in ('EHLO', 'HELO'):
+                self.reply("250 fake-smtp")
+            elif verb in ('MAIL', 'RCPT', 'RSET', 'NOOP'):
+                self.reply("250 OK")
+            elif verb == 'DATA':
+                message = []
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+            elif verb == 'QUIT':
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """Minimal soxta SMTP server"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _SMTPHandler)
+        self.received = []
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite - collectors, socket fan-out va alert yo'li bitta JSON hisobotda
+
+    python3 benchmarks/run_all.py --output results/$(git describe --always).json
+    python3 benchmarks/run_all.py --quick
+
+Hisobotda git versiya saqlanadi - versiyalar orasida regressiyani solishtirish uchun.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_alerts
+import bench_collectors
+import bench_fanout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def git_version():
+    """Joriy commit (git bo'lmasa - None)"""
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], cwd=ROOT,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monitoring benchmark suite")
+    parser.add_argument('--quick', action='store_true', help="kichik o'lchamlar (tezkor tekshiruv)")
+    parser.add_argument('--output', help="JSON hisobot fayli")
+    args = parser.parse_args()
+
+    if args.quick:
+        sizes, repeat, clients, duration, alerts = (100, 1000), 3, (10, 50), 2, 10
+    else:
+        sizes, repeat, clients, duration, alerts = (100, 1000, 10000, 50000), 5, (10, 100, 500), 5, 50
+
+    report = {
+        'version': git_version(),
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'benchmarks': [
+            bench_collectors.run(sizes, repeat),
+            bench_fanout.run(clients, duration),
+            bench_alerts.run(alerts),
+            bench_alerts.run(max(alerts // 5, 1), delay=0.5)
+        ]
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
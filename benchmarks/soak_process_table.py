@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Soak test - PID churn ostida ProcessTable xotirasi o'smasligini tekshirish
+
+    python3 benchmarks/soak_process_table.py --duration 604800 --processes 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_records import ProcessTable, current_rss_bytes
+from synthetic_proc import SyntheticProc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ProcessTable soak test")
+    parser.add_argument('--duration', type=float, default=7 * 24 * 3600, help="soniyalar (default: 7 kun)")
+    parser.add_argument('--cycles', type=int, default=None, help="duration o'rniga sikllar soni")
+    parser.add_argument('--processes', type=int, default=2000)
+    parser.add_argument('--churn', type=float, default=0.05, help="har siklda almashadigan ulush")
+    parser.add_argument('--interval', type=float, default=1.0)
+    parser.add_argument('--sample-every', type=int, default=60)
+    parser.add_argument('--max-growth-mb', type=float, default=5.0)
+    args = parser.parse_args()
+
+    fixture = SyntheticProc(args.processes)
+    table = ProcessTable(proc_root=fixture.root)
+    samples = []
+
+    try:
+        deadline = time.monotonic() + args.duration
+        cycle = 0
+        while (cycle < args.cycles) if args.cycles is not None else (time.monotonic() < deadline):
+            cycle += 1
+            fixture.churn(args.churn)
+            fixture.tick()
+
+            blocks = sys.getallocatedblocks()
+            table.scan()
+            table.top('cpu')
+            table.top('memory_mb')
+
+            if cycle % args.sample_every == 1:
+                samples.append({
+                    'cycle': cycle,
+                    'rss_mb': round(current_rss_bytes() / (1024 * 1024), 2),
+                    'allocated_blocks_delta': sys.getallocatedblocks() - blocks,
+                    'records': len(table.records),
+                    'evicted_total': table.evicted_total
+                })
+
+            if args.interval > 0:
+                time.sleep(args.interval)
+    finally:
+        fixture.cleanup()
+
+    # Birinchi namunalar - isinish davri, o'sishni undan keyin hisoblaymiz
+    baseline = samples[min(1, len(samples) - 1)]['rss_mb'] if samples else 0
+    growth = samples[-1]['rss_mb'] - baseline if samples else 0
+
+    print(json.dumps({
+        'benchmark': 'soak_process_table',
+        'cycles': cycle,
+        'processes': args.processes,
+        'churn': args.churn,
+        'rss_growth_mb': round(growth, 2),
+        'flat': growth <= args.max_growth_mb,
+        'samples': samples
+    }, indent=2))
+
+    sys.exit(0 if growth <= args.max_growth_mb else 1)
+
+
+if __name__ == "__main__":
+    main()
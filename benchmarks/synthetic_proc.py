@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Synthetic /proc - benchmark va soak testlar uchun soxta process jadvali
+"""
+
+import os
+import random
+import shutil
+import tempfile
+
+PROCESS_NAMES = (
+    'nginx', 'postgres', 'java', 'python3', 'node', 'redis-server',
+    'sshd', 'systemd-journald', 'containerd-shim-runc-v2', 'kworker/0:1'
+)
+
+
+class SyntheticProc:
+    """Vaqtinchalik papkada /proc/<pid>/{stat,statm,cmdline} fayllari"""
+
+    def __init__(self, count=1000, root=None, seed=0):
+        self.root = root or tempfile.mkdtemp(prefix='synthetic_proc_')
+        self.random = random.Random(seed)
+        self.next_pid = 1
+        self.clock = 1000
+        self.pids = {}  # pid -> [name, ticks, rss_pages, start_time]
+
+        with open(os.path.join(self.root, 'stat'), 'w') as f:
+            f.write("cpu  100 0 100 1000 0 0 0 0 0 0\nbtime 1700000000\n")
+
+        for _ in range(count):
+            self.spawn()
+
+    def spawn(self):
+        """Yangi soxta process yaratish"""
+        pid = self.next_pid
+        self.next_pid += 1
+        self.clock += 1
+
+        name = self.random.choice(PROCESS_NAMES)
+        self.pids[pid] = [name, 0, self.random.randint(100, 50000), self.clock]
+        os.mkdir(os.path.join(self.root, str(pid)))
+        with open(os.path.join(self.root, str(pid), 'cmdline'), 'wb') as f:
+            f.write(f"/usr/bin/{name}\0--worker\0{pid}\0".encode())
+        self._write(pid)
+        return pid
+
+    def kill(self, pid):
+        """Soxta processni o'chirish"""
+        del self.pids[pid]
+        shutil.rmtree(os.path.join(self.root, str(pid)), ignore_errors=True)
+
+    def tick(self, busy_fraction=0.1):
+        """CPU vaqtini oshirish va stat fayllarni qayta yozish"""
+        for pid, entry in self.pids.items():
+            if self.random.random() < busy_fraction:
+                entry[1] += self.random.randint(1, 100)
+                self._write(pid)
+
+    def churn(self, fraction=0.05):
+        """Processlarning bir qismini o'ldirib, yangilarini yaratish"""
+        victims = self.random.sample(list(self.pids), int(len(self.pids) * fraction))
+        for pid in victims:
+            self.kill(pid)
+        for _ in victims:
+            self.spawn()
+
+    def _write(self, pid):
+        name, ticks, rss_pages, start_time = self.pids[pid]
+        fields = ['S', '1', str(pid), str(pid), '0', '-1', '4194560', '0', '0', '0', '0',
+                  str(ticks // 2), str(ticks - ticks // 2), '0', '0', '20', '0', '1', '0',
+                  str(start_time), str(rss_pages * 4096), str(rss_pages)]
+        with open(os.path.join(self.root, str(pid), 'stat'), 'w') as f:
+            f.write(f"{pid} ({name}) {' '.join(fields)}\n")
+        with open(os.path.join(self.root, str(pid), 'statm'), 'w') as f:
+            f.write(f"{rss_pages * 2} {rss_pages} 0 0 0 0 0\n")
+
+    def cleanup(self):
+        """Vaqtinchalik papkani o'chirish"""
+        shutil.rmtree(self.root, ignore_errors=True)
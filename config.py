@@ -51,6 +51,8 @@ class ConfigManager:
         keys = key.split('.')
         value = self.config
         for k in keys:
+            if not isinstance(value, dict):
+                return default
             value = value.get(k, default)
             if value is None:
                 return default
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Disk Forecast - har bir mount uchun to'lish vaqtini (time-to-full) bashorat qilish
+
+Sliding window chiziqli regressiya yig'indilar orqali yangilanadi (O(1)),
+outlier namunalar qoldiqlar shkalasi bo'yicha qirqiladi (robust).
+Qirqilgan qoldiqlar ketma-ket bir tomonda qolsa (dump, o'chirish) - trend
+yangi darajadan qayta boshlanadi.
+"""
+
+import math
+from collections import deque
+
+# Qoldiqlar shkalasining pastki chegarasi - kichik tebranishlarni outlier deb hisoblamaslik uchun
+MIN_SCALE = 1024 * 1024
+
+
+class DiskTrend:
+    """Bitta mount uchun sliding window robust chiziqli trend"""
+
+    def __init__(self, window=900, clip=3.0, min_samples=30, shift_samples=10):
+        self.window = window
+        self.clip = clip
+        self.min_samples = min_samples
+        self.shift_samples = shift_samples
+        self.samples = deque()  # (t, y)
+
+        # Bir tomonga qirqilgan ketma-ket namunalar (asl qiymatlari) - daraja siljishi
+        self.shift_run = []
+        self.shift_sign = 0
+
+        # Yig'indilar (x = t - t0)
+        self.t0 = None
+        self.n = 0
+        self.sx = 0.0
+        self.sy = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+
+        # Qoldiqlar shkalasi (EWMA |residual|)
+        self.scale = None
+
+    def add(self, t, y):
+        """Yangi namuna (vaqt, ishlatilgan baytlar)"""
+        if self.samples and t <= self.samples[-1][0]:
+            return
+
+        if self.t0 is None:
+            self.t0 = t
+
+        # Robust: bashoratdan juda uzoq namunani chegaragacha qirqamiz
+        if self.n >= self.min_samples:
+            predicted = self.predict(t)
+            residual = y - predicted
+            if self.scale is None:
+                self.scale = abs(residual)
+            bound = self.clip * max(self.scale, MIN_SCALE)
+            if abs(residual) > bound:
+                sign = 1 if residual > 0 else -1
+                if sign != self.shift_sign:
+                    self.shift_run = []
+                    self.shift_sign = sign
+                self.shift_run.append((t, y))
+                if len(self.shift_run) >= self.shift_samples:
+                    # Daraja o'zgardi - eski namunalar endi slope'ni buzadi
+                    self._reset(self.shift_run)
+                    return
+                y = predicted + math.copysign(bound, residual)
+                residual = y - predicted
+            else:
+                self.shift_run = []
+                self.shift_sign = 0
+            self.scale = 0.95 * self.scale + 0.05 * abs(residual)
+
+        self.samples.append((t, y))
+        self._add_sums(t, y, 1)
+
+        # Oynadan chiqqan namunalar
+        while self.samples and self.samples[0][0] < t - self.window:
+            old_t, old_y = self.samples.popleft()
+            self._add_sums(old_t, old_y, -1)
+
+        # x qiymatlari katta bo'lib ketmasligi uchun t0 ni siljitamiz (O(1))
+        if t - self.t0 > self.window * 10:
+            self._rebase(self.samples[0][0])
+
+    def _reset(self, samples):
+        """Trendni berilgan namunalardan qayta boshlash"""
+        self.samples.clear()
+        self.t0 = samples[0][0]
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = 0.0
+        self.scale = None
+        self.shift_run = []
+        self.shift_sign = 0
+        for t, y in samples:
+            self.samples.append((t, y))
+            self._add_sums(t, y, 1)
+
+    def _add_sums(self, t, y, sign):
+        x = t - self.t0
+        self.n += sign
+        self.sx += sign * x
+        self.sy += sign * y
+        self.sxx += sign * x * x
+        self.sxy += sign * x * y
+
+    def _rebase(self, new_t0):
+        """Yig'indilarni yangi t0 ga o'tkazish"""
+        d = new_t0 - self.t0
+        self.sxx -= 2 * d * self.sx - self.n * d * d
+        self.sxy -= d * self.sy
+        self.sx -= self.n * d
+        self.t0 = new_t0
+
+    def fit(self):
+        """(slope, intercept) - bayt/soniya; yetarli ma'lumot bo'lmasa None"""
+        if self.n < 2:
+            return None
+        denominator = self.n * self.sxx - self.sx * self.sx
+        if denominator <= 0:
+            return None
+        slope = (self.n * self.sxy - self.sx * self.sy) / denominator
+        intercept = (self.sy - slope * self.sx) / self.n
+        return slope, intercept
+
+    def predict(self, t):
+        fitted = self.fit()
+        if fitted is None:
+            return self.sy / self.n if self.n else 0.0
+        slope, intercept = fitted
+        return intercept + slope * (t - self.t0)
+
+    def time_to_full(self, capacity, used):
+        """
+        To'lishgacha soniyalar (o'smayotgan bo'lsa None)
+
+        capacity - yozish mumkin bo'lgan chegara (used + free). total emas:
+        reserved block'lar (ext4 da 5%) tufayli ENOSPC used == total dan oldin.
+        used - joriy haqiqiy qiymat: robust fit faqat slope uchun, qirqilgan
+        bashorat keskin sakrashdan keyin haqiqiy darajadan orqada qoladi.
+        """
+        if self.n < self.min_samples:
+            return None
+        fitted = self.fit()
+        if fitted is None or fitted[0] <= 0:
+            return None
+        slope, _ = fitted
+        return max(capacity - used, 0) / slope
+
+
+class DiskForecaster:
+    """Barcha mountlar uchun trendlar va horizon bo'yicha ogohlantirish"""
+
+    def __init__(self, horizon=3600, window=900, min_samples=30):
+        self.horizon = horizon
+        self.window = window
+        self.min_samples = min_samples
+        self.trends = {}
+
+    def update(self, disks, ts):
+        """
+        disks: [{'mount', 'total', 'used', 'free', 'percent'}, ...]
+
+        Horizon ichida to'ladigan mountlar ro'yxatini qaytaradi.
+        """
+        forecasts = []
+        seen = set()
+        for disk in disks:
+            mount = disk['mount']
+            seen.add(mount)
+
+            trend = self.trends.get(mount)
+            if trend is None:
+                trend = self.trends[mount] = DiskTrend(self.window, min_samples=self.min_samples)
+            trend.add(ts, disk['used'])
+
+            # free = f_bavail (root bo'lmagan foydalanuvchi uchun bo'sh joy)
+            free = disk.get('free', disk['total'] - disk['used'])
+            eta = trend.time_to_full(disk['used'] + free, disk['used'])
+            if eta is not None and eta < self.horizon:
+                forecasts.append({
+                    'mount': mount,
+                    'eta_seconds': eta,
+                    'rate_bytes_per_sec': trend.fit()[0],
+                    'used': disk['used'],
+                    'free': free,
+                    'total': disk['total'],
+                    'percent': disk['percent']
+                })
+
+        # Yo'qolgan (unmount qilingan) mountlar
+        for mount in list(self.trends):
+            if mount not in seen:
+                del self.trends[mount]
+
+        return forecasts
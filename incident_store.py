@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Incident Store - SQLite (WAL) da incidentlar tarixi
+
+Hot path faqat navbatga yozadi; alohida writer thread yozuvlarni
+batch tranzaksiyalarda bajaradi.
+
+    python3 incident_store.py summary --days 30
+    python3 incident_store.py offenders --metric memory --days 30
+    python3 incident_store.py list --metric cpu --limit 20
+"""
+
+import argparse
+import logging
+import queue
+import socket
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    threshold REAL,
+    opened_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    resolved_at REAL,
+    duration REAL,
+    peak_value REAL,
+    last_value REAL
+);
+CREATE INDEX IF NOT EXISTS idx_incidents_metric_time ON incidents(metric, opened_at);
+CREATE INDEX IF NOT EXISTS idx_incidents_time ON incidents(opened_at);
+
+CREATE TABLE IF NOT EXISTS incident_offenders (
+    incident_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    name TEXT NOT NULL,
+    pid INTEGER,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS idx_offenders_name_time ON incident_offenders(name, ts);
+CREATE INDEX IF NOT EXISTS idx_offenders_incident ON incident_offenders(incident_id);
+"""
+
+_STOP = object()
+
+
+def connect(db_path):
+    """SQLite ulanish (WAL rejimi)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class IncidentStore:
+    def __init__(self, db_path='incidents.db', batch_interval=2.0, max_batch=500,
+                 max_queue=10000, retry_interval=60):
+        self.db_path = db_path
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.retry_interval = retry_interval
+        self.host = socket.gethostname()
+        # Chegaralangan navbat - DB ishlamasa xotira cheksiz o'smaydi
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Writer threadni ishga tushirish"""
+        if self.thread is None:
+            self.stopping.clear()
+            self.thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Navbatdagi yozuvlarni yozib, threadni to'xtatish"""
+        if self.thread is not None:
+            self.stopping.set()
+            try:
+                self.queue.put_nowait(_STOP)
+            except queue.Full:
+                pass  # writer navbat bo'shaganda stopping'ni ko'radi
+            self.thread.join(timeout=10)
+            self.thread = None
+
+    def open_incident(self, metric, value, threshold, offenders=None, ts=None):
+        """Yangi incident - id qaytaradi"""
+        ts = ts or time.time()
+        incident_id = uuid.uuid4().hex
+        self._put((
+            "INSERT INTO incidents (id, host, metric, threshold, opened_at, updated_at, peak_value, last_value) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (incident_id, self.host, metric, threshold, ts, ts, value, value)
+        ))
+        if offenders:
+            self._put_offenders(incident_id, offenders, ts)
+        return incident_id
+
+    def update_incident(self, incident_id, value, offenders=None, ts=None):
+        """Incident davom etmoqda - oxirgi va eng yuqori qiymat"""
+        ts = ts or time.time()
+        self._put((
+            "UPDATE incidents SET updated_at = ?, last_value = ?, peak_value = MAX(peak_value, ?) WHERE id = ?",
+            (ts, value, value, incident_id)
+        ))
+        if offenders:
+            # Cho'qqidagi top offenderlarni saqlaymiz
+            self._put(("DELETE FROM incident_offenders WHERE incident_id = ?", (incident_id,)))
+            self._put_offenders(incident_id, offenders, ts)
+
+    def resolve_incident(self, incident_id, ts=None):
+        """Incident tugadi"""
+        ts = ts or time.time()
+        self._put((
+            "UPDATE incidents SET resolved_at = ?, updated_at = ?, duration = ? - opened_at WHERE id = ?",
+            (ts, ts, ts, incident_id)
+        ))
+
+    def _put_offenders(self, incident_id, offenders, ts):
+        value_key = 'cpu' if 'cpu' in offenders[0] else 'memory_mb'
+        rows = [(incident_id, ts, p['name'], p['pid'], p.get(value_key)) for p in offenders]
+        self._put((
+            "INSERT INTO incident_offenders (incident_id, ts, name, pid, value) VALUES (?, ?, ?, ?, ?)",
+            rows,
+            True  # executemany
+        ))
+
+    def _put(self, op):
+        """Navbatga qo'yish - to'lgan bo'lsa (writer ishlamayapti) yozuv tashlanadi"""
+        try:
+            self.queue.put_nowait(op)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logging.error(f"❌ Incident navbati to'lgan: {self.dropped} ta yozuv tashlandi")
+
+    def _open(self):
+        conn = connect(self.db_path)
+        # Oldingi ishga tushirishdan ochiq qolgan incidentlar - oxirgi ko'rilgan vaqtda yopiladi
+        with conn:
+            conn.execute(
+                "UPDATE incidents SET resolved_at = updated_at, duration = updated_at - opened_at "
+                "WHERE resolved_at IS NULL AND host = ?",
+                (self.host,)
+            )
+        return conn
+
+    def _writer_loop(self):
+        """Batch yozuvchi: navbatni yig'ib, bitta tranzaksiyada bajaradi"""
+        conn = None
+        while conn is None:
+            try:
+                conn = self._open()
+            except sqlite3.Error as e:
+                logging.error(f"❌ Incident DB ochishda xato: {e} ({self.retry_interval}s dan keyin qayta urinish)")
+                if self.stopping.wait(self.retry_interval):
+                    return
+
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            deadline = time.time() + self.batch_interval
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0 or batch[-1] is _STOP:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            if batch[-1] is _STOP:
+                stopping = True
+                batch.pop()
+            elif self.stopping.is_set() and self.queue.empty():
+                stopping = True
+
+            try:
+                with conn:
+                    for op in batch:
+                        if len(op) == 3:
+                            conn.executemany(op[0], op[1])
+                        else:
+                            conn.execute(op[0], op[1])
+            except sqlite3.Error as e:
+                logging.error(f"❌ Incident DB yozishda xato: {e}")
+
+        conn.close()
+
+
+class IncidentTracker:
+    """Metrika bo'yicha incident lifecycle: opened -> updated -> resolved"""
+
+    def __init__(self, store, update_interval=30):
+        self.store = store
+        self.update_interval = update_interval
+        self.open = {}  # metric -> {'id', 'peak', 'last_update'}
+
+    def observe(self, metric, value, threshold, offenders=None, ts=None):
+        """Yangi qiymat - faqat holat o'zgarganda yoki cho'qqida DB ga yoziladi"""
+        ts = ts or time.time()
+        incident = self.open.get(metric)
+
+        if value > threshold:
+            if incident is None:
+                self.open[metric] = {
+                    'id': self.store.open_incident(metric, value, threshold, offenders, ts),
+                    'peak': value,
+                    'last_update': ts
+                }
+            elif value > incident['peak']:
+                incident['peak'] = value
+                incident['last_update'] = ts
+                self.store.update_incident(incident['id'], value, offenders, ts)
+            elif ts - incident['last_update'] >= self.update_interval:
+                incident['last_update'] = ts
+                self.store.update_incident(incident['id'], value, ts=ts)
+        elif incident is not None:
+            self.store.resolve_incident(incident['id'], ts)
+            del self.open[metric]
+
+
+def _format_duration(seconds):
+    if seconds is None:
+        return "-"
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m {int(seconds % 60)}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incident tarixi")
+    parser.add_argument('command', choices=['summary', 'offenders', 'list'])
+    parser.add_argument('--db', default='incidents.db')
+    parser.add_argument('--metric')
+    parser.add_argument('--name', help="offender process nomi")
+    parser.add_argument('--days', type=float, default=30)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    since = time.time() - args.days * 86400
+    started = time.perf_counter()
+
+    metric_filter = " AND metric = ?" if args.metric else ""
+    params = [since] + ([args.metric] if args.metric else [])
+
+    if args.command == 'summary':
+        rows = conn.execute(
+            "SELECT metric, COUNT(*), SUM(duration), AVG(duration), MAX(duration), MAX(peak_value) "
+            f"FROM incidents WHERE opened_at >= ?{metric_filter} GROUP BY metric ORDER BY metric",
+            params
+        ).fetchall()
+        print(f"{'Metric':<10} {'Count':>6} {'Total':>10} {'Avg':>10} {'Max':>10} {'Peak':>7}")
+        for metric, count, total, avg, longest, peak in rows:
+            print(f"{metric:<10} {count:>6} {_format_duration(total):>10} {_format_duration(avg):>10} "
+                  f"{_format_duration(longest):>10} {peak:>6.1f}%")
+
+    elif args.command == 'offenders':
+        metric_filter = " AND i.metric = ?" if args.metric else ""
+        name_filter = " AND o.name = ?" if args.name else ""
+        rows = conn.execute(
+            "SELECT o.name, COUNT(DISTINCT o.incident_id), MAX(o.value) "
+            "FROM incident_offenders o JOIN incidents i ON i.id = o.incident_id "
+            f"WHERE o.ts >= ?{metric_filter}{name_filter} "
+            "GROUP BY o.name ORDER BY 2 DESC LIMIT ?",
+            params + ([args.name] if args.name else []) + [args.limit]
+        ).fetchall()
+        print(f"{'Process':<30} {'Incidents':>9} {'Max':>10}")
+        for name, count, value in rows:
+            print(f"{name[:30]:<30} {count:>9} {value or 0:>10.1f}")
+
+    else:
+        rows = conn.execute(
+            "SELECT metric, opened_at, duration, peak_value, resolved_at IS NULL "
+            f"FROM incidents WHERE opened_at >= ?{metric_filter} ORDER BY opened_at DESC LIMIT ?",
+            params + [args.limit]
+        ).fetchall()
+        for metric, opened_at, duration, peak, is_open in rows:
+            opened = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(opened_at))
+            status = "OPEN" if is_open else _format_duration(duration)
+            print(f"{opened}  {metric:<8} peak {peak:>5.1f}%  {status}")
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"\n⏱️ {elapsed_ms:.1f} ms", file=sys.stderr)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
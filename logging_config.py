@@ -1,15 +1,270 @@
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler, QueueHandler, QueueListener
 import os
+import queue
+import re
+import socket
+import threading
+import time
 
-def setup_logging(log_level=logging.INFO, use_rotation=True):
+# Faol queue listener va navbat handleri (async rejimda)
+_listener = None
+_queue_handler = None
+
+# Bostirilgan/tashlangan yozuvlar haqida davriy hisobot thread'i
+_maintenance = None
+
+HOSTNAME = socket.gethostname()
+
+
+def load_logging_options(config_file='config.json'):
+    """config.json dagi 'logging' bo'limini o'qish"""
+    try:
+        with open(config_file, 'r') as f:
+            return json.load(f).get('logging', {})
+    except (OSError, ValueError):
+        return {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Structured JSON-lines format - log shipper uchun"""
+    
+    # logging.warning(..., extra={...}) orqali beriladigan maydonlar
+    STRUCTURED_FIELDS = ('alert_type', 'metrics', 'threshold', 'pid', 'top_process', 'suppressed')
+    
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'host': HOSTNAME,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        for field in self.STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Takrorlanuvchi xabarlarni cheklash: har bir shablon uchun `per` soniyada `rate` ta"""
+    
+    _DIGITS = re.compile(r'\d+(\.\d+)?')
+    
+    def __init__(self, rate=5, per=60):
+        super().__init__()
+        self.rate = rate
+        self.per = per
+        self.lock = threading.Lock()
+        self.windows = {}  # shablon -> [oyna boshi, soni, bostirilgan]
+    
+    def filter(self, record):
+        # Yig'ma hisobot yozuvlari cheklanmaydi
+        if getattr(record, 'suppressed', None):
+            return True
+        
+        # f-string xabarlardagi raqamlarni bir xil shablonga keltiramiz
+        key = (record.levelno, self._DIGITS.sub('#', str(record.msg)))
+        now = time.monotonic()
+        
+        with self.lock:
+            window = self.windows.get(key)
+            if window is None or now - window[0] >= self.per:
+                suppressed = window[2] if window else 0
+                self.windows[key] = [now, 1, 0]
+                if len(self.windows) > 1000:
+                    self._evict(now)
+                if suppressed:
+                    record.suppressed = suppressed
+                    if isinstance(record.msg, str):
+                        record.msg = f"{record.msg} ({suppressed} ta o'xshash xabar bostirildi)"
+                return True
+            
+            if window[1] < self.rate:
+                window[1] += 1
+                return True
+            
+            window[2] += 1
+            return False
+    
+    def expired(self, now=None):
+        """Muddati tugagan oynalarni yopish: bostirilganlari bor bo'lsa [(level, shablon, soni)]"""
+        now = time.monotonic() if now is None else now
+        summaries = []
+        with self.lock:
+            for key, window in list(self.windows.items()):
+                if now - window[0] >= self.per:
+                    if window[2]:
+                        summaries.append((key[0], key[1], window[2]))
+                    del self.windows[key]
+        return summaries
+    
+    def _evict(self, now):
+        """Eskirgan oynalarni o'chirish (lock ichida)"""
+        expired = [k for k, w in self.windows.items() if now - w[0] >= self.per]
+        for k in expired:
+            del self.windows[k]
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Hot threadlar faqat navbatga qo'yadi - formatlash listener threadda"""
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record):
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Navbat to'lgan (disk sekin) - threadni bloklamaymiz
+            self.dropped += 1
+
+
+class LogMaintenance(threading.Thread):
+    """
+    Davriy hisobot: oynasi tugagan bostirilgan xabarlar va navbat to'lgani
+    uchun tashlangan yozuvlar soni (aks holda burst tugasa yo'qolib ketadi)
+    """
+    
+    def __init__(self, filtered, queue_handler=None, handlers=(), interval=10):
+        super().__init__(name='log-maintenance', daemon=True)
+        self.filtered = filtered  # [(handler, RateLimitFilter)]
+        self.queue_handler = queue_handler
+        self.handlers = handlers
+        self.interval = interval
+        self.reported_dropped = 0
+        self.stopped = threading.Event()
+    
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+    
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.flush(final=True)
+    
+    def flush(self, final=False):
+        for handler, rate_filter in self.filtered:
+            # Yakunda - oyna tugashini kutmasdan hammasi
+            for level, template, count in rate_filter.expired(float('inf') if final else None):
+                record = self._record(level, f"{template} ({count} ta o'xshash xabar bostirildi)")
+                record.suppressed = count
+                handler.handle(record)
+        
+        if self.queue_handler is not None:
+            dropped = self.queue_handler.dropped
+            if dropped > self.reported_dropped:
+                record = self._record(
+                    logging.WARNING,
+                    f"Log navbati to'lgan: {dropped - self.reported_dropped} ta yozuv tashlandi (jami {dropped})"
+                )
+                # Navbat to'la bo'lishi mumkin - to'g'ridan-to'g'ri handlerlarga
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+                self.reported_dropped = dropped
+    
+    @staticmethod
+    def _record(level, message):
+        return logging.LogRecord('logging_config', level, __file__, 0, message, None, None)
+
+
+def dropped_log_records():
+    """Async navbat to'lgani uchun tashlangan yozuvlar soni"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def _install_handlers(logger, handlers, options):
+    """Handlerlarni to'g'ridan-to'g'ri yoki queue orqali ulash"""
+    global _listener, _queue_handler, _maintenance
+    
+    stop_logging()
+    _queue_handler = None
+    
+    # JSON faqat fayl uchun - console odam o'qiydigan formatda qoladi
+    if options.get('json', False):
+        json_formatter = JsonFormatter()
+        for handler in handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.setFormatter(json_formatter)
+    
+    rate_limit = options.get('rate_limit', {'messages': 5, 'per_seconds': 60})
+    
+    def make_filter():
+        return RateLimitFilter(rate_limit['messages'], rate_limit['per_seconds'])
+    
+    filtered = []
+    flush_interval = options.get('flush_interval', 10)
+    
+    if not options.get('async', True):
+        for handler in handlers:
+            if rate_limit:
+                rate_filter = make_filter()
+                handler.addFilter(rate_filter)
+                filtered.append((handler, rate_filter))
+            logger.addHandler(handler)
+        
+        if filtered:
+            _maintenance = LogMaintenance(filtered, interval=flush_interval)
+            _maintenance.start()
+        return logger
+    
+    # Async: hot threadlar faqat enqueue qiladi, bitta listener thread yozadi
+    log_queue = queue.Queue(maxsize=options.get('queue_size', 10000))
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    if rate_limit:
+        rate_filter = make_filter()
+        _queue_handler.addFilter(rate_filter)
+        filtered.append((_queue_handler, rate_filter))
+    logger.addHandler(_queue_handler)
+    
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    _maintenance = LogMaintenance(filtered, _queue_handler, handlers, interval=flush_interval)
+    _maintenance.start()
+    
+    return logger
+
+
+def stop_logging():
+    """Navbatdagi yozuvlarni diskka yozib, listener threadni to'xtatish"""
+    global _listener, _maintenance
+    
+    # Avval yig'ma hisobotlar - listener ularni ham yozib ulgursin
+    if _maintenance is not None:
+        _maintenance.stop()
+        _maintenance = None
+    
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def setup_logging(log_level=logging.INFO, use_rotation=True, options=None):
     """
     Logging setup with automatic rotation
     
     Args:
         log_level: Logging level (INFO, WARNING, ERROR)
         use_rotation: True - rotating by size, False - daily rotation
+        options: config.json 'logging' bo'limi (async, json, rate_limit)
     """
+    if options is None:
+        options = load_logging_options()
     
     # Log directory
     log_dir = 'logs'
@@ -49,19 +304,20 @@ def setup_logging(log_level=logging.INFO, use_rotation=True):
     
     file_handler.setFormatter(formatter)
     file_handler.setLevel(log_level)
-    logger.addHandler(file_handler)
     
     # Console handler - faqat WARNING va yuqori
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.WARNING)  # Faqat muhim xabarlar
-    logger.addHandler(console_handler)
     
-    return logger
+    return _install_handlers(logger, [file_handler, console_handler], options)
 
 
-def setup_socket_server_logging():
+def setup_socket_server_logging(options=None):
     """Socket server uchun minimal logging"""
+    if options is None:
+        options = load_logging_options()
+    
     log_dir = 'logs'
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -80,19 +336,20 @@ def setup_socket_server_logging():
         encoding='utf-8'
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Console - faqat ERROR
     console = logging.StreamHandler()
     console.setLevel(logging.ERROR)
     console.setFormatter(formatter)
-    logger.addHandler(console)
     
-    return logger
+    return _install_handlers(logger, [file_handler, console], options)
 
 
-def setup_monitoring_logging():
+def setup_monitoring_logging(options=None):
     """Monitoring uchun detailed logging"""
+    if options is None:
+        options = load_logging_options()
+    
     log_dir = 'logs'
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -111,12 +368,10 @@ def setup_monitoring_logging():
         encoding='utf-8'
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Console - INFO va yuqori
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
     console.setFormatter(formatter)
-    logger.addHandler(console)
     
-    return logger
\ No newline at end of file
+    return _install_handlers(logger, [file_handler, console], options)
@@ -7,13 +7,22 @@ Real-time monitoring + Telegram alerts
 import logging
 import time
 import os
+import signal
 import sys
 import socket as sock
 import json
 import threading
 
 from config import ConfigManager
-from telegram_notifier import TelegramNotifier
+from disk_forecast import DiskForecaster
+from incident_store import IncidentStore, IncidentTracker
+
+# Anomaly detection - NumPy o'rnatilgan bo'lsa
+try:
+    from anomaly_detector import AnomalyDetector
+except ImportError:
+    AnomalyDetector = None
+from notifiers import MultiNotifier
 
 # Logging sozlash
 from logging_config import setup_monitoring_logging
@@ -26,25 +35,52 @@ class SocketMonitoringIntegration:
         self.config = ConfigManager(config_file)
         self.socket_path = socket_path
         
-        # Telegram notifier
-        bot_token = self.config.get('telegram.bot_token')
-        chat_id = self.config.get('telegram.chat_id')
+        # Notifier kanallari (Telegram, webhook, email, fayl/syslog)
+        self.notifier = MultiNotifier.from_config(self.config)
         
-        if not bot_token or not chat_id or bot_token == 'YOUR_BOT_TOKEN':
-            logging.error("❌ Telegram bot_token va chat_id to'ldirilmagan!")
+        if not self.notifier.channels:
+            logging.error("❌ Hech qanday notifier kanali sozlanmagan!")
             sys.exit(1)
         
-        self.notifier = TelegramNotifier(bot_token, chat_id)
-        
         # Alert tracking
         self.last_alerts = {
             'cpu': 0,
             'memory': 0,
-            'disk': 0
+            'disk': 0,
+            'anomaly': 0
         }
         
+        # Disk to'lish bashorati
+        self.disk_forecaster = None
+        if self.config.get('disk_forecast.enabled', True):
+            self.disk_forecaster = DiskForecaster(
+                horizon=self.config.get('disk_forecast.horizon_minutes', 60) * 60,
+                window=self.config.get('disk_forecast.window_minutes', 15) * 60,
+                min_samples=self.config.get('disk_forecast.min_samples', 30)
+            )
+        
+        # Baseline-aware anomaly detector
+        self.anomaly_detector = None
+        self.anomaly_model_path = self.config.get('anomaly.model_path', 'anomaly_model.npz')
+        self.last_model_save = time.time()
+        if self.config.get('anomaly.enabled', False):
+            if AnomalyDetector is None:
+                logging.warning("⚠️ NumPy topilmadi - anomaly detection o'chirilgan")
+            else:
+                self.anomaly_detector = AnomalyDetector.load_or_create(
+                    self.anomaly_model_path,
+                    z_threshold=self.config.get('anomaly.z_threshold', 4.0)
+                )
+        
+        # Incident tarixi (SQLite)
+        self.incident_store = IncidentStore(self.config.get('incidents.db_path', 'incidents.db'))
+        self.incidents = IncidentTracker(self.incident_store)
+        
         self.running = False
+        self.stopped = False
         self.client_socket = None
+        self.last_metrics_ts = None
+        self.last_processes_ts = None
     
     def connect_to_socket(self):
         """Socket serverga ulanish"""
@@ -72,6 +108,7 @@ class SocketMonitoringIntegration:
             return
         
         self.running = True
+        self.incident_store.start()
         
         # Startup message
         self._send_startup_message()
@@ -97,13 +134,19 @@ class SocketMonitoringIntegration:
                         pass
                 
         except KeyboardInterrupt:
-            self.stop()
+            pass
         except Exception as e:
             logging.error(f"❌ Monitoring xatosi: {e}")
+        finally:
+            # Har qanday chiqishda (server uzilishi ham) - incidentlar va model saqlanadi
             self.stop()
     
     def stop(self):
         """Monitoring to'xtatish"""
+        if self.stopped:
+            return
+        self.stopped = True
+        
         logging.info("\n" + "=" * 60)
         logging.info("⛔ Monitoring to'xtatilmoqda...")
         logging.info("=" * 60)
@@ -113,11 +156,24 @@ class SocketMonitoringIntegration:
         if self.client_socket:
             self.client_socket.close()
         
+        # Navbatdagi incident yozuvlari (resolve ham) diskka yoziladi
+        self.incident_store.stop()
+        if self.anomaly_detector:
+            try:
+                self.anomaly_detector.save(self.anomaly_model_path)
+            except Exception as e:
+                logging.error(f"❌ Anomaly modelni saqlashda xato: {e}")
         self._send_stop_message()
         logging.info("✅ Monitoring to'xtatildi")
     
     def _process_metrics(self, data):
         """Metrikalarni tekshirish va alert yuborish"""
+        # Bir xil o'lchov qayta kelsa (eski server) - detektorlarga ikki marta bermaymiz
+        ts = data.get('timestamp')
+        if ts is not None and ts == self.last_metrics_ts:
+            return
+        self.last_metrics_ts = ts
+        
         # Config qayta yuklash
         self.config.reload_config()
         
@@ -130,6 +186,19 @@ class SocketMonitoringIntegration:
         memory_threshold = self.config.get('thresholds.memory_percent', 85)
         disk_threshold = self.config.get('thresholds.disk_percent', 90)
         
+        # Process ro'yxati yangi skanerdanmi? (tinch rejimda server eskisini qayta yuboradi)
+        processes_ts = data.get('processes_timestamp')
+        processes_fresh = processes_ts is None or processes_ts != self.last_processes_ts
+        self.last_processes_ts = processes_ts
+        
+        # Incident lifecycle - eski skanerdagi offenderlar yozilmaydi
+        ts = ts or time.time()
+        self.incidents.observe('cpu', cpu, cpu_threshold,
+                               data['top_cpu_processes'] if processes_fresh else None, ts)
+        self.incidents.observe('memory', memory, memory_threshold,
+                               data['top_memory_processes'] if processes_fresh else None, ts)
+        self.incidents.observe('disk', disk, disk_threshold, ts=ts)
+        
         # CPU check
         if cpu > cpu_threshold and self._should_send_alert('cpu'):
             self._send_cpu_alert(data, cpu_threshold)
@@ -141,12 +210,37 @@ class SocketMonitoringIntegration:
         # Disk check
         if disk > disk_threshold and self._should_send_alert('disk'):
             self._send_disk_alert(data, disk_threshold)
+        
+        # Watchlist (process bo'yicha qoidalar) - faqat yangi skaner natijasi
+        violations_by_rule = {}
+        for violation in data.get('watchlist_violations', []) if processes_fresh else []:
+            violations_by_rule.setdefault(violation['rule'], []).append(violation)
+        for rule, violations in violations_by_rule.items():
+            if self._should_send_alert(f"watch:{rule}"):
+                self._send_watchlist_alert(data, rule, violations)
+        
+        # Disk forecast (time-to-full)
+        if self.disk_forecaster:
+            for forecast in self.disk_forecaster.update(data.get('disks', []), ts):
+                if self._should_send_alert(f"disk_forecast:{forecast['mount']}"):
+                    self._send_disk_forecast_alert(data, forecast)
+        
+        # Anomaly check (baseline'dan sezilarli og'ish)
+        if self.anomaly_detector:
+            anomalies = self.anomaly_detector.update(data, ts)
+            if anomalies and self._should_send_alert('anomaly'):
+                self._send_anomaly_alert(data, anomalies)
+            
+            # Modelni har 5 daqiqada saqlash
+            if time.time() - self.last_model_save > 300:
+                self.anomaly_detector.save(self.anomaly_model_path)
+                self.last_model_save = time.time()
     
     def _should_send_alert(self, alert_type):
         """Alert yuborish kerakmi?"""
         cooldown = self.config.get('alert_cooldown', 300)
         current_time = time.time()
-        time_passed = current_time - self.last_alerts[alert_type]
+        time_passed = current_time - self.last_alerts.get(alert_type, 0)
         
         if time_passed > cooldown:
             return True
@@ -166,6 +260,7 @@ class SocketMonitoringIntegration:
         
         alert_data = {
             'emoji': '🚨',
+            'severity': 'critical',
             'title': 'CPU ALERT',
             'date': now,
             'hostname': hostname,
@@ -184,9 +279,14 @@ class SocketMonitoringIntegration:
             cpu_val = f"{proc['cpu']:.1f}%"
             alert_data['processes'].append(f"{i:<2}. {name:<20} {cpu_val:>7}")
         
+        self._attach_drilldown(alert_data, data['top_cpu_processes'], ['threads', 'files'])
+        
         if self.notifier.send_formatted_alert(alert_data):
             self.last_alerts['cpu'] = time.time()
-            logging.warning(f"🔴 CPU alert yuborildi: {data['cpu']:.1f}%")
+            logging.warning(
+                f"🔴 CPU alert yuborildi: {data['cpu']:.1f}%",
+                extra=self._log_fields('cpu', data, threshold, data['top_cpu_processes'])
+            )
     
     def _send_memory_alert(self, data, threshold):
         """Memory alert"""
@@ -199,6 +299,7 @@ class SocketMonitoringIntegration:
         
         alert_data = {
             'emoji': '🚨',
+            'severity': 'critical',
             'title': 'Memory ALERT',
             'date': now,
             'hostname': hostname,
@@ -219,9 +320,14 @@ class SocketMonitoringIntegration:
             mem_val = f"{mem_mb:.0f}M" if mem_mb < 1024 else f"{mem_mb/1024:.1f}G"
             alert_data['processes'].append(f"{i:<2}. {name:<20} {mem_val:>7}")
         
+        self._attach_drilldown(alert_data, data['top_memory_processes'], ['files', 'io'])
+        
         if self.notifier.send_formatted_alert(alert_data):
             self.last_alerts['memory'] = time.time()
-            logging.warning(f"🟡 Memory alert yuborildi: {data['memory']:.1f}%")
+            logging.warning(
+                f"🟡 Memory alert yuborildi: {data['memory']:.1f}%",
+                extra=self._log_fields('memory', data, threshold, data['top_memory_processes'])
+            )
     
     def _send_disk_alert(self, data, threshold):
         """Disk alert"""
@@ -234,6 +340,7 @@ class SocketMonitoringIntegration:
         
         alert_data = {
             'emoji': '🚨',
+            'severity': 'critical',
             'title': 'Disk ALERT',
             'date': now,
             'hostname': hostname,
@@ -249,7 +356,222 @@ class SocketMonitoringIntegration:
         
         if self.notifier.send_formatted_alert(alert_data):
             self.last_alerts['disk'] = time.time()
-            logging.warning(f"💾 Disk alert yuborildi: {data['disk']:.1f}%")
+            logging.warning(
+                f"💾 Disk alert yuborildi: {data['disk']:.1f}%",
+                extra=self._log_fields('disk', data, threshold)
+            )
+    
+    def _send_watchlist_alert(self, data, rule, violations):
+        """Watchlist alert - qoidaga mos process threshold'dan oshdi"""
+        from datetime import datetime
+        
+        hostname = sock.gethostname()
+        ip = self._get_ip_address()
+        uptime = self._get_uptime()
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        metric = violations[0]['metric']
+        threshold = violations[0]['threshold']
+        
+        def format_value(value):
+            if metric == 'cpu':
+                return f"{value:.1f}%"
+            return f"{value:.0f}M" if value < 1024 else f"{value/1024:.1f}G"
+        
+        alert_data = {
+            'emoji': '👁️',
+            'severity': 'critical',
+            'title': 'WATCHLIST ALERT',
+            'date': now,
+            'hostname': hostname,
+            'ip': ip,
+            'uptime': uptime,
+            'metrics': [
+                f"📋 Rule: {rule[:36]}",
+                f"⚠️ {'CPU' if metric == 'cpu' else 'RSS'} > {format_value(threshold)}"
+            ],
+            'process_title': f"{len(violations)} Matching Processes:",
+            'processes': []
+        }
+        
+        for i, violation in enumerate(violations, 1):
+            name = violation['name'][:20]
+            alert_data['processes'].append(f"{i:<2}. {name:<20} {format_value(violation['value']):>7}")
+        
+        self._attach_drilldown(
+            alert_data, violations,
+            ['threads', 'files'] if metric == 'cpu' else ['files', 'io']
+        )
+        
+        if self.notifier.send_formatted_alert(alert_data):
+            self.last_alerts[f"watch:{rule}"] = time.time()
+            fields = self._log_fields('watchlist', data, threshold, violations)
+            fields['metrics']['rule'] = rule
+            fields['metrics']['value'] = violations[0]['value']
+            logging.warning(
+                f"👁️ Watchlist alert yuborildi: {rule} ({violations[0]['name']} {format_value(violations[0]['value'])})",
+                extra=fields
+            )
+    
+    def _send_disk_forecast_alert(self, data, forecast):
+        """Disk forecast alert - horizon ichida to'lishi kutilmoqda"""
+        from datetime import datetime, timedelta
+        
+        hostname = sock.gethostname()
+        ip = self._get_ip_address()
+        uptime = self._get_uptime()
+        now = datetime.now()
+        
+        eta = forecast['eta_seconds']
+        eta_text = f"{int(eta // 3600)}h {int((eta % 3600) // 60)}m" if eta >= 3600 else f"{int(eta // 60)}m {int(eta % 60)}s"
+        full_at = (now + timedelta(seconds=eta)).strftime('%H:%M:%S')
+        rate_mb = forecast['rate_bytes_per_sec'] * 60 / (1024**2)
+        
+        alert_data = {
+            'emoji': '⏳',
+            'severity': 'warning',
+            'title': 'Disk FORECAST',
+            'date': now.strftime('%Y-%m-%d %H:%M:%S'),
+            'hostname': hostname,
+            'ip': ip,
+            'uptime': uptime,
+            'metrics': [
+                f"💾 Mount: {forecast['mount'][:32]}",
+                f"📊 Used: {forecast['percent']:.1f}% of {forecast['total'] / (1024**3):.1f}G",
+                f"🆓 Free: {forecast['free'] / (1024**3):.1f}G",
+                f"📈 Fill rate: {rate_mb:.1f}M/min",
+                f"⏰ ETA: {eta_text} (~{full_at})"
+            ],
+            'processes': []
+        }
+        
+        if self.notifier.send_formatted_alert(alert_data):
+            self.last_alerts[f"disk_forecast:{forecast['mount']}"] = time.time()
+            fields = self._log_fields('disk_forecast', data, None)
+            fields['metrics'].update({
+                'mount': forecast['mount'],
+                'eta_seconds': round(eta),
+                'rate_bytes_per_sec': round(forecast['rate_bytes_per_sec'])
+            })
+            logging.warning(
+                f"⏳ Disk forecast alert yuborildi: {forecast['mount']} ~{eta_text}",
+                extra=fields
+            )
+    
+    def _send_anomaly_alert(self, data, anomalies):
+        """Anomaly alert - metrika o'z baseline'idan sezilarli og'di"""
+        from datetime import datetime
+        
+        hostname = sock.gethostname()
+        ip = self._get_ip_address()
+        uptime = self._get_uptime()
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        alert_data = {
+            'emoji': '📈',
+            'severity': 'warning',
+            'title': 'ANOMALY ALERT',
+            'date': now,
+            'hostname': hostname,
+            'ip': ip,
+            'uptime': uptime,
+            'metrics': [],
+            'process_title': f"Top {len(data['top_cpu_processes'])} CPU-Consuming Processes:",
+            'processes': []
+        }
+        
+        for anomaly in anomalies:
+            alert_data['metrics'].append(
+                f"{anomaly['metric'].upper()}: {anomaly['value']:.1f}% (norma {anomaly['expected']:.1f}±{anomaly['std']:.1f})"
+            )
+            alert_data['metrics'].append(f"   Og'ish: {anomaly['z']:+.1f}σ ({anomaly['baseline']})")
+        
+        for i, proc in enumerate(data['top_cpu_processes'], 1):
+            name = proc['name'][:20]
+            cpu_val = f"{proc['cpu']:.1f}%"
+            alert_data['processes'].append(f"{i:<2}. {name:<20} {cpu_val:>7}")
+        
+        if self.notifier.send_formatted_alert(alert_data):
+            self.last_alerts['anomaly'] = time.time()
+            fields = self._log_fields('anomaly', data, None, data['top_cpu_processes'])
+            fields['metrics']['anomalies'] = anomalies
+            logging.warning(
+                f"📈 Anomaly alert yuborildi: {', '.join(a['metric'] for a in anomalies)}",
+                extra=fields
+            )
+    
+    def _log_fields(self, alert_type, data, threshold, processes=None):
+        """Structured (JSON) log uchun qo'shimcha maydonlar"""
+        fields = {
+            'alert_type': alert_type,
+            'threshold': threshold,
+            'metrics': {key: data.get(key) for key in ('cpu', 'memory', 'disk')}
+        }
+        if processes:
+            fields['pid'] = processes[0]['pid']
+            fields['top_process'] = processes[0]['name']
+        return fields
+    
+    def _attach_drilldown(self, alert_data, processes, fields):
+        """Top-1 process drill-down ma'lumotini alertga qo'shish"""
+        if not self.config.get('alert_drilldown', False) or not processes:
+            return
+        
+        # Drill-down ixtiyoriy - har qanday xatoda alert detallarsiz yuboriladi
+        try:
+            details = self._request_pid_details(processes[0]['pid'], fields)
+            if not details or 'error' in details:
+                return
+            
+            lines = self._format_drilldown(details)
+        except Exception as e:
+            logging.error(f"❌ Drill-down formatlashda xato: {e}")
+            return
+        
+        alert_data['details_title'] = f"🔍 Drill-down: {str(details.get('name', '?'))[:24]}"
+        alert_data['details'] = lines
+    
+    def _format_drilldown(self, details):
+        """Inspector natijasidan alert qatorlari (xato bo'lgan maydonlar tashlanadi)"""
+        cmdline = details.get('cmdline')
+        lines = [f"PID {details['pid']}: {cmdline[:34] if isinstance(cmdline, str) else '-'}"]
+        if isinstance(details.get('num_threads'), int):
+            lines.append(f"Threads: {details['num_threads']}")
+        if isinstance(details.get('threads'), list) and details['threads']:
+            top = details['threads'][0]
+            lines.append(f"Top thread: {top['tid']} {top['cpu']:.1f}%")
+        if isinstance(details.get('files'), dict) and 'fds' in details['files']:
+            files = details['files']
+            lines.append(f"FDs: {files['fds']} | Sockets: {files['sockets']}")
+        if isinstance(details.get('io'), dict) and 'read_bytes_per_sec' in details['io']:
+            io = details['io']
+            lines.append(f"IO: R {io['read_bytes_per_sec'] / 1024:.0f}K/s W {io['write_bytes_per_sec'] / 1024:.0f}K/s")
+        return lines
+    
+    def _request_pid_details(self, pid, fields, timeout=5):
+        """Alohida ulanish orqali PID drill-down so'rash"""
+        request = {'cmd': 'pid_details', 'pid': pid, 'fields': ['cmdline', 'num_threads'] + fields}
+        
+        try:
+            with sock.socket(sock.AF_UNIX, sock.SOCK_STREAM) as s:
+                s.settimeout(timeout)
+                s.connect(self.socket_path)
+                s.sendall((json.dumps(request) + '\n').encode('utf-8'))
+                
+                buffer = ""
+                while True:
+                    chunk = s.recv(4096).decode('utf-8')
+                    if not chunk:
+                        return None
+                    buffer += chunk
+                    while '\n' in buffer:
+                        line, buffer = buffer.split('\n', 1)
+                        response = json.loads(line)
+                        if response.get('type') == 'pid_details':
+                            return response['details']
+        except Exception as e:
+            logging.error(f"❌ PID drill-down xatosi: {e}")
+            return None
     
     def _get_ip_address(self):
         """IP manzil"""
@@ -293,7 +615,7 @@ class SocketMonitoringIntegration:
         message += "│🔌 Mode: Unix Socket (Real-time)          │\n"
         message += "└────────────────────────────────────────────┘"
         
-        self.notifier.send_message(f"<pre>{message}</pre>")
+        self.notifier.send_message(f"<pre>{message}</pre>", severity='info')
     
     def _send_stop_message(self):
         """To'xtatish xabari"""
@@ -306,7 +628,7 @@ class SocketMonitoringIntegration:
         message += f"│🗓️ Date: {now:<30}│\n"
         message += "└────────────────────────────────────────────┘"
         
-        self.notifier.send_message(f"<pre>{message}</pre>")
+        self.notifier.send_message(f"<pre>{message}</pre>", severity='info')
 
 
 def main():
@@ -322,6 +644,9 @@ def main():
         logging.info("📝 Config.json faylida Telegram ma'lumotlarini to'ldiring")
         return
     
+    # systemd stop (SIGTERM) ham start() dagi finally orqali to'xtatadi
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     # Monitoring boshlash
     monitor = SocketMonitoringIntegration(config_file)
     monitor.start()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Notifiers - bir nechta kanalga parallel alert yuborish
+
+Har bir kanal o'z thread'ida ishlaydi (o'z timeout, retry va severity
+routing bilan) - sekin yoki osilib qolgan kanal boshqalarini kechiktirmaydi.
+"""
+
+import html
+import json
+import logging
+import re
+import smtplib
+import socket
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from email.message import EmailMessage
+
+import requests
+
+from telegram_notifier import TelegramNotifier, format_alert
+
+SEVERITIES = {'info': 0, 'warning': 1, 'critical': 2}
+
+
+def strip_html(message):
+    """HTML teglarsiz matn (Telegram bo'lmagan kanallar uchun)"""
+    return html.unescape(re.sub(r'<[^>]+>', '', message))
+
+
+class NotificationChannel(ABC):
+    """Kanal asosi: retry, timeout va severity bo'yicha filtrlash"""
+
+    def __init__(self, name, timeout=10, retries=1, retry_delay=1, min_severity='info', severities=None):
+        self.name = name
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.min_severity = SEVERITIES.get(min_severity, 0)
+        self.severities = set(severities) if severities else None
+
+        # Har bir kanal uchun alohida thread - failure isolation
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"notify-{name}")
+
+    def accepts(self, severity):
+        """Bu severity shu kanalga yo'naltiriladimi?"""
+        if self.severities is not None:
+            return severity in self.severities
+        return SEVERITIES.get(severity, 0) >= self.min_severity
+
+    @property
+    def deadline(self):
+        """Barcha urinishlar uchun maksimal vaqt"""
+        return self.timeout * (self.retries + 1) + self.retry_delay * self.retries
+
+    def send(self, message, alert_data=None, severity='info'):
+        """Yuborish (retry bilan) - True/False"""
+        for attempt in range(self.retries + 1):
+            try:
+                if self.deliver(message, alert_data, severity):
+                    return True
+            except Exception as e:
+                logging.error(f"❌ {self.name} kanal xatosi: {e}")
+
+            if attempt < self.retries:
+                time.sleep(self.retry_delay)
+
+        logging.error(f"❌ {self.name} kanal: {self.retries + 1} urinish muvaffaqiyatsiz")
+        return False
+
+    @abstractmethod
+    def deliver(self, message, alert_data, severity):
+        """Bitta urinish - muvaffaqiyatli bo'lsa True"""
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+
+class TelegramChannel(NotificationChannel):
+    def __init__(self, bot_token, chat_id, api_url='https://api.telegram.org', **options):
+        super().__init__(options.pop('name', 'telegram'), **options)
+        self.notifier = TelegramNotifier(bot_token, chat_id, api_url=api_url, timeout=self.timeout)
+
+    def deliver(self, message, alert_data, severity):
+        return self.notifier.send_message(message)
+
+
+class WebhookChannel(NotificationChannel):
+    """Umumiy JSON webhook"""
+
+    def __init__(self, url, headers=None, **options):
+        super().__init__(options.pop('name', 'webhook'), **options)
+        self.url = url
+        self.headers = headers or {}
+
+    def deliver(self, message, alert_data, severity):
+        payload = {
+            'host': socket.gethostname(),
+            'severity': severity,
+            'text': strip_html(message),
+            'alert': alert_data
+        }
+        response = requests.post(self.url, json=payload, headers=self.headers, timeout=self.timeout)
+        if response.status_code >= 300:
+            logging.error(f"❌ Webhook xato: {response.status_code} {response.text[:200]}")
+            return False
+        return True
+
+
+class EmailChannel(NotificationChannel):
+    """SMTP email"""
+
+    def __init__(self, host, to, sender=None, port=25, username=None, password=None,
+                 starttls=False, **options):
+        super().__init__(options.pop('name', 'email'), **options)
+        self.host = host
+        self.port = port
+        self.to = [to] if isinstance(to, str) else list(to)
+        self.sender = sender or f"monitoring@{socket.gethostname()}"
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+
+    def deliver(self, message, alert_data, severity):
+        email = EmailMessage()
+        title = alert_data['title'] if alert_data else 'Monitoring'
+        email['Subject'] = f"[{severity.upper()}] {socket.gethostname()}: {title}"
+        email['From'] = self.sender
+        email['To'] = ', '.join(self.to)
+        email.set_content(strip_html(message))
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(email)
+        return True
+
+
+class FileChannel(NotificationChannel):
+    """Lokal fayl (JSON-lines) yoki syslog"""
+
+    def __init__(self, path=None, syslog=False, **options):
+        super().__init__(options.pop('name', 'syslog' if syslog else 'file'), **options)
+        self.path = path
+        self.syslog = syslog
+
+    def deliver(self, message, alert_data, severity):
+        text = strip_html(message)
+
+        if self.syslog:
+            import syslog
+            priority = {'info': syslog.LOG_INFO, 'warning': syslog.LOG_WARNING}.get(severity, syslog.LOG_CRIT)
+            for line in text.splitlines():
+                syslog.syslog(priority, line)
+
+        if self.path:
+            entry = {'time': time.time(), 'severity': severity, 'text': text, 'alert': alert_data}
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return True
+
+
+CHANNEL_TYPES = {
+    'telegram': TelegramChannel,
+    'webhook': WebhookChannel,
+    'email': EmailChannel,
+    'file': FileChannel
+}
+
+
+class MultiNotifier:
+    """Kanallar bo'yicha fan-out - TelegramNotifier bilan bir xil interfeys"""
+
+    def __init__(self, channels):
+        self.channels = channels
+
+    @classmethod
+    def from_config(cls, config):
+        """config.json 'notifiers' ro'yxati (bo'lmasa - faqat 'telegram' bo'limi)"""
+        entries = config.get('notifiers') or [{'type': 'telegram'}]
+
+        channels = []
+        for entry in entries:
+            entry = dict(entry)
+            if not entry.pop('enabled', True):
+                continue
+
+            channel_type = entry.pop('type', None)
+            if channel_type == 'telegram':
+                entry.setdefault('bot_token', config.get('telegram.bot_token'))
+                entry.setdefault('chat_id', config.get('telegram.chat_id'))
+                if not entry['bot_token'] or not entry['chat_id'] or entry['bot_token'] == 'YOUR_BOT_TOKEN':
+                    logging.error("❌ Telegram bot_token va chat_id to'ldirilmagan!")
+                    continue
+            if channel_type == 'email' and 'from' in entry:
+                entry['sender'] = entry.pop('from')
+
+            try:
+                channels.append(CHANNEL_TYPES[channel_type](**entry))
+            except (KeyError, TypeError) as e:
+                logging.error(f"❌ Notifier sozlamasi xato ({channel_type}): {e}")
+
+        return cls(channels)
+
+    def send_message(self, message, severity='info', alert_data=None):
+        """
+        Mos kanallarga parallel yuborish
+
+        Birinchi muvaffaqiyatli kanal bilan True qaytaradi; qolganlari
+        o'z thread'larida davom etadi.
+        """
+        targets = [c for c in self.channels if c.accepts(severity)]
+        if not targets:
+            return False
+
+        futures = {
+            channel.executor.submit(channel.send, message, alert_data, severity): channel
+            for channel in targets
+        }
+
+        try:
+            for future in as_completed(futures, timeout=max(c.deadline for c in targets)):
+                if future.result():
+                    return True
+        except TimeoutError:
+            pending = [futures[f].name for f in futures if not f.done()]
+            logging.error(f"❌ Notifier timeout: {', '.join(pending)}")
+
+        return False
+
+    def send_formatted_alert(self, alert_data):
+        """Formatlangan alert yuborish"""
+        message = format_alert(alert_data)
+        return self.send_message(f"<pre>{message}</pre>", alert_data.get('severity', 'critical'), alert_data)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
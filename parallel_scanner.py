@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Parallel Process Scanner - katta hostlarda /proc ni bir nechta
+worker process'larda skanerlash
+"""
+
+import heapq
+import logging
+import multiprocessing
+import os
+
+from watchlist import Watchlist
+
+CLK_TCK = os.sysconf('SC_CLK_TCK')
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+# Worker ichidagi holat (chaqiruvlar orasida saqlanadi - worker doim bir xil PID bo'lagini oladi)
+_worker_watchlist = Watchlist()
+_worker_table = None
+
+
+def list_pids(proc_root='/proc'):
+    """Barcha PID'lar ro'yxati"""
+    return [int(name) for name in os.listdir(proc_root) if name.isdigit()]
+
+
+def read_stat(proc_root, pid):
+    """/proc/<pid>/stat dan (name, cpu_ticks, rss_bytes, start_time) o'qish"""
+    with open(f'{proc_root}/{pid}/stat', 'rb') as f:
+        data = f.read()
+
+    # comm ichida bo'sh joy va qavs bo'lishi mumkin - oxirgi ')' bo'yicha ajratamiz
+    start = data.find(b'(')
+    end = data.rfind(b')')
+    name = data[start + 1:end].decode('utf-8', 'replace')
+    fields = data[end + 2:].split()
+
+    # fields[0] = state (3-maydon), utime=14, stime=15, starttime=22, rss=24
+    ticks = int(fields[11]) + int(fields[12])
+    rss = int(fields[21]) * PAGE_SIZE
+    start_time = int(fields[19])
+    return name, ticks, rss, start_time
+
+
+def scan_chunk(args):
+    """
+    Worker: PID bo'lagini bitta o'qishda skanerlash
+
+    Serial rejim bilan bir xil ProcessTable - CPU oldingi skandan beri
+    hisoblanadi. Parent faqat lokal top-K, guruh agregatlari va watchlist
+    natijalarini birlashtiradi.
+    """
+    global _worker_table
+    proc_root, pids, limit, rules = args
+    _worker_watchlist.configure(rules)
+
+    if _worker_table is None or _worker_table.proc_root != proc_root:
+        # process_records bu moduldan import qiladi - aylanma importdan qochish uchun shu yerda
+        from process_records import ProcessTable
+        _worker_table = ProcessTable(proc_root)
+    table = _worker_table
+    table.scan(pids)
+
+    top_cpu = [(r.cpu, r.pid, r.name) for r in table.top('cpu', limit)]
+    top_memory = [(r.memory_mb, r.pid, r.name) for r in table.top('memory_mb', limit)]
+
+    groups = {}
+    for record in table.records.values():
+        group = groups.get(record.name)
+        if group is None:
+            groups[record.name] = [record.cpu, record.memory_mb, 1]
+        else:
+            group[0] += record.cpu
+            group[1] += record.memory_mb
+            group[2] += 1
+
+    violations = _worker_watchlist.evaluate(
+        ((r.pid, r.start_time, r.name, r.cpu, r.memory_mb) for r in table.records.values()),
+        proc_root
+    ) if rules else []
+    return top_cpu, top_memory, groups, violations, _worker_watchlist.misses
+
+
+def _worker_loop(conn):
+    """
+    Doimiy worker: har doim bir xil PID bo'lagini (pid % workers) oladi,
+    shuning uchun worker ichidagi keshlar chaqiruvlar orasida foydali qoladi
+    """
+    while True:
+        try:
+            args = conn.recv()
+        except EOFError:
+            return
+        if args is None:
+            return
+        conn.send(scan_chunk(args))
+
+
+class ParallelProcessScanner:
+    """PID maydonini worker process'lar orasida bo'lib skanerlash"""
+
+    def __init__(self, workers=None, threshold=5000, proc_root='/proc'):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.threshold = threshold
+        self.proc_root = proc_root
+        self.processes = []
+        self.connections = []
+
+    def should_use(self, process_count):
+        """Process soni chegaradan oshsa parallel rejim"""
+        return self.workers > 1 and process_count >= self.threshold
+
+    def _start_workers(self):
+        # Worker'lar _monitor_loop ichida (boshqa thread'lar ishlab turganda) yaratiladi -
+        # fork qulflangan lock'larni meros qilib olishi mumkin, shuning uchun forkserver
+        context = multiprocessing.get_context('forkserver')
+        for _ in range(self.workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker_loop, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self.processes.append(process)
+            self.connections.append(parent_conn)
+        logging.info(f"⚡ Parallel scanner ishga tushdi: {self.workers} worker")
+
+    def scan(self, pids=None, limit=5, rules=None):
+        """Parallel skanerlash: top CPU, top memory, guruhlar va watchlist"""
+        if pids is None:
+            pids = list_pids(self.proc_root)
+
+        if not self.processes:
+            self._start_workers()
+
+        # PID bo'yicha barqaror bo'linish - o'lgan PID boshqalarni siljitmaydi
+        chunks = [[] for _ in range(self.workers)]
+        for pid in pids:
+            chunks[pid % self.workers].append(pid)
+
+        try:
+            # Avval hammasiga yuborib, keyin yig'amiz - worker'lar parallel ishlaydi
+            for conn, chunk in zip(self.connections, chunks):
+                conn.send((self.proc_root, chunk, limit, rules or []))
+            results = [conn.recv() for conn in self.connections]
+        except (EOFError, OSError) as e:
+            # Worker o'lgan - keyingi skanda qayta ishga tushadi
+            self.close()
+            raise RuntimeError(f"Parallel scanner worker xatosi: {e}")
+
+        return self.merge(results, limit)
+
+    @staticmethod
+    def merge(results, limit):
+        """Worker natijalarini birlashtirish"""
+        top_cpu = heapq.nlargest(limit, (e for r in results for e in r[0]))
+        top_memory = heapq.nlargest(limit, (e for r in results for e in r[1]))
+
+        groups = {}
+        for worker_groups in (r[2] for r in results):
+            for name, (cpu, memory_mb, count) in worker_groups.items():
+                group = groups.get(name)
+                if group is None:
+                    groups[name] = [cpu, memory_mb, count]
+                else:
+                    group[0] += cpu
+                    group[1] += memory_mb
+                    group[2] += count
+
+        top_groups = heapq.nlargest(limit, groups.items(), key=lambda item: item[1][0])
+
+        return {
+            'top_cpu': [
+                {'pid': pid, 'name': name, 'cpu': round(cpu, 1)}
+                for cpu, pid, name in top_cpu
+            ],
+            'top_memory': [
+                {'pid': pid, 'name': name, 'memory_mb': round(memory_mb, 1)}
+                for memory_mb, pid, name in top_memory
+            ],
+            'groups': [
+                {'name': name, 'cpu': round(cpu, 1), 'memory_mb': round(memory_mb, 1), 'count': count}
+                for name, (cpu, memory_mb, count) in top_groups
+            ],
+            'watchlist_violations': Watchlist.limit([v for r in results for v in r[3]]),
+            'watchlist_cache_misses': sum(r[4] for r in results)
+        }
+
+    def close(self):
+        """Worker process'larni to'xtatish"""
+        for conn in self.connections:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process in self.processes:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+        for conn in self.connections:
+            conn.close()
+        self.processes = []
+        self.connections = []
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+PID Inspector - bitta process haqida batafsil ma'lumot (drill-down)
+
+Qimmat maydonlar faqat so'ralganda hisoblanadi, qisqa TTL bilan
+keshlanadi va bir vaqtda kelgan bir xil so'rovlar birlashtiriladi.
+"""
+
+import logging
+import threading
+import time
+
+import psutil
+
+# Arzon maydonlar - har doim qaytariladi
+CHEAP_FIELDS = ('cmdline', 'num_threads', 'ctx_switches', 'cgroup')
+
+# Qimmat maydonlar - faqat so'ralganda
+EXPENSIVE_FIELDS = ('threads', 'files', 'io')
+
+ALL_FIELDS = CHEAP_FIELDS + EXPENSIVE_FIELDS
+
+
+class PidInspector:
+    def __init__(self, ttl=5, sample_interval=0.5):
+        self.ttl = ttl
+        self.sample_interval = sample_interval
+        self.lock = threading.Lock()
+        self.cache = {}       # (pid, field) -> (vaqt, qiymat)
+        self.inflight = {}    # (pid, field) -> threading.Event
+
+    def inspect(self, pid, fields=None):
+        """PID haqida ma'lumot - faqat so'ralgan maydonlar"""
+        fields = [f for f in (fields or CHEAP_FIELDS) if f in ALL_FIELDS]
+
+        try:
+            proc = psutil.Process(pid)
+            details = {
+                'pid': pid,
+                'name': proc.name(),
+                'create_time': proc.create_time()
+            }
+        except psutil.NoSuchProcess:
+            return {'pid': pid, 'error': 'no such process'}
+        except psutil.AccessDenied:
+            return {'pid': pid, 'error': 'access denied'}
+
+        for field in fields:
+            details[field] = self._get_field(proc, field)
+
+        return details
+
+    def _get_field(self, proc, field):
+        """Keshdan olish yoki hisoblash (bir xil so'rovlar birlashtiriladi)"""
+        key = (proc.pid, proc.create_time(), field)
+
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry and time.time() - entry[0] < self.ttl:
+                return entry[1]
+
+            event = self.inflight.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self.inflight[key] = event
+
+        if not owner:
+            # Boshqa client allaqachon hisoblayapti - natijani kutamiz
+            event.wait(self.sample_interval * 4 + 5)
+            with self.lock:
+                entry = self.cache.get(key)
+            return entry[1] if entry else None
+
+        try:
+            value = self._compute(proc, field)
+        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+            value = {'error': type(e).__name__}
+        except Exception as e:
+            logging.error(f"PID {proc.pid} {field} hisoblashda xato: {e}")
+            value = {'error': str(e)}
+
+        with self.lock:
+            self.cache[key] = (time.time(), value)
+            self.inflight.pop(key, None)
+            self._evict_expired()
+        event.set()
+        return value
+
+    def _evict_expired(self):
+        """Eskirgan kesh yozuvlarini o'chirish (lock ichida chaqiriladi)"""
+        now = time.time()
+        expired = [k for k, (ts, _) in self.cache.items() if now - ts >= self.ttl]
+        for k in expired:
+            del self.cache[k]
+
+    def _compute(self, proc, field):
+        """Bitta maydonni hisoblash"""
+        if field == 'cmdline':
+            return ' '.join(proc.cmdline())
+
+        if field == 'num_threads':
+            return proc.num_threads()
+
+        if field == 'ctx_switches':
+            ctx = proc.num_ctx_switches()
+            return {'voluntary': ctx.voluntary, 'involuntary': ctx.involuntary}
+
+        if field == 'cgroup':
+            try:
+                with open(f'/proc/{proc.pid}/cgroup') as f:
+                    return f.read().strip()
+            except OSError:
+                return None
+
+        if field == 'threads':
+            # Har bir thread uchun CPU - ikki o'lchov orasidagi farq
+            before = {t.id: t.user_time + t.system_time for t in proc.threads()}
+            time.sleep(self.sample_interval)
+            threads = []
+            for t in proc.threads():
+                total = t.user_time + t.system_time
+                cpu = (total - before.get(t.id, total)) / self.sample_interval * 100
+                threads.append({'tid': t.id, 'cpu': round(cpu, 1)})
+            return sorted(threads, key=lambda x: x['cpu'], reverse=True)
+
+        if field == 'files':
+            connections = getattr(proc, 'net_connections', None) or proc.connections
+            return {
+                'fds': proc.num_fds(),
+                'open_files': len(proc.open_files()),
+                'sockets': len(connections(kind='all'))
+            }
+
+        if field == 'io':
+            before = proc.io_counters()
+            time.sleep(self.sample_interval)
+            after = proc.io_counters()
+            return {
+                'read_bytes_per_sec': round((after.read_bytes - before.read_bytes) / self.sample_interval),
+                'write_bytes_per_sec': round((after.write_bytes - before.write_bytes) / self.sample_interval)
+            }
+
+        return None
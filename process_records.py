@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Process Records - ixcham (__slots__) process yozuvlari jadvali
+
+Yozuvlar sikldan siklga qayta ishlatiladi, nomlar intern qilinadi,
+o'lgan PID'lar esa aniq o'chiriladi - uzoq ishlaydigan server
+xotirasi o'smasligi uchun.
+"""
+
+import heapq
+import sys
+import time
+
+from parallel_scanner import CLK_TCK, PAGE_SIZE, list_pids, read_stat
+
+# comm 15 belgigacha qisqartiriladi - to'liq nomni cmdline dan olamiz
+COMM_MAX_LEN = 15
+
+
+def current_rss_bytes():
+    """Joriy process RSS (baytlarda)"""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * PAGE_SIZE
+
+
+class ProcessRecord:
+    """Bitta process yozuvi - (pid, start_time) bo'yicha aniqlanadi"""
+    __slots__ = ('pid', 'start_time', 'name', 'ticks', 'cpu', 'memory_mb', 'cycle')
+
+    def __init__(self, pid, start_time, name, ticks):
+        self.pid = pid
+        self.start_time = start_time
+        self.name = name
+        self.ticks = ticks
+        self.cpu = 0.0
+        self.memory_mb = 0.0
+        self.cycle = 0
+
+
+class ProcessTable:
+    """PID -> ProcessRecord jadvali"""
+
+    def __init__(self, proc_root='/proc'):
+        self.proc_root = proc_root
+        self.records = {}
+        self.cycle = 0
+        self.last_scan = None
+        self.peak_size = 0
+        self.evicted_last = 0
+        self.evicted_total = 0
+
+    def scan(self, pids=None):
+        """Barcha processlarni bitta o'tishda yangilash (CPU + memory)"""
+        self.cycle += 1
+        now = time.monotonic()
+        elapsed = now - self.last_scan if self.last_scan else None
+        self.last_scan = now
+
+        records = self.records
+        if pids is None:
+            pids = list_pids(self.proc_root)
+
+        for pid in pids:
+            try:
+                name, ticks, rss, start_time = read_stat(self.proc_root, pid)
+            except (OSError, ValueError, IndexError):
+                continue
+
+            record = records.get(pid)
+            if record is None or record.start_time != start_time:
+                # Yangi process (yoki PID qayta ishlatilgan)
+                record = ProcessRecord(pid, start_time, self._resolve_name(pid, name), ticks)
+                records[pid] = record
+            else:
+                if elapsed:
+                    record.cpu = (ticks - record.ticks) / CLK_TCK / elapsed * 100
+                record.ticks = ticks
+
+            record.memory_mb = rss / (1024 * 1024)
+            record.cycle = self.cycle
+
+        self._evict_stale()
+
+    def _resolve_name(self, pid, name):
+        """Process nomi (intern qilingan)"""
+        if len(name) >= COMM_MAX_LEN:
+            try:
+                with open(f'{self.proc_root}/{pid}/cmdline', 'rb') as f:
+                    exe = f.read().split(b'\0', 1)[0].rsplit(b'/', 1)[-1].decode('utf-8', 'replace')
+                if exe.startswith(name):
+                    name = exe
+            except OSError:
+                pass
+        return sys.intern(name)
+
+    def _evict_stale(self):
+        """Bu siklda ko'rinmagan (o'lgan) PID'larni o'chirish"""
+        stale = [pid for pid, record in self.records.items() if record.cycle != self.cycle]
+        for pid in stale:
+            del self.records[pid]
+
+        self.evicted_last = len(stale)
+        self.evicted_total += len(stale)
+
+        # dict o'chirishda kichraymaydi - cho'qqidan ancha kichik bo'lsa qayta quramiz
+        self.peak_size = max(self.peak_size, len(self.records) + len(stale))
+        if self.peak_size > 1024 and len(self.records) < self.peak_size // 2:
+            self.records = dict(self.records)
+            self.peak_size = len(self.records)
+
+    def top(self, attr, limit=5):
+        """attr (cpu yoki memory_mb) bo'yicha top yozuvlar"""
+        if attr == 'cpu':
+            candidates = (r for r in self.records.values() if r.cpu > 0)
+        else:
+            candidates = self.records.values()
+        return heapq.nlargest(limit, candidates, key=lambda r: getattr(r, attr))
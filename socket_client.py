@@ -12,6 +12,7 @@ class MonitoringClient:
     def __init__(self, socket_path='/tmp/monitor.sock'):
         self.socket_path = socket_path
         self.client_socket = None
+        self.buffer = ""
         
     def connect(self):
         """Serverga ulanish"""
@@ -37,20 +38,36 @@ class MonitoringClient:
     def receive_data(self):
         """Ma'lumot olish"""
         try:
-            buffer = ""
-            while True:
+            while '\n' not in self.buffer:
                 chunk = self.client_socket.recv(4096).decode('utf-8')
                 if not chunk:
                     return None
-                
-                buffer += chunk
-                if '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    return json.loads(line)
+                self.buffer += chunk
+            
+            line, self.buffer = self.buffer.split('\n', 1)
+            return json.loads(line)
         except Exception as e:
             print(f"❌ Ma'lumot olishda xato: {e}")
             return None
     
+    def request_pid_details(self, pid, fields=None):
+        """PID bo'yicha batafsil ma'lumot so'rash"""
+        request = {'cmd': 'pid_details', 'pid': pid}
+        if fields:
+            request['fields'] = fields
+        self.client_socket.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        
+        # Oqimdagi metrika qatorlarini o'tkazib yuborib, javobni kutish
+        while True:
+            data = self.receive_data()
+            if data is None:
+                return None
+            if data.get('type') == 'pid_details':
+                return data['details']
+            if data.get('type') == 'error':
+                print(f"❌ Server xatosi: {data['error']}")
+                return None
+    
     def display_dashboard(self, data):
         """Dashboard ko'rsatish"""
         # Clear screen
@@ -69,6 +86,8 @@ class MonitoringClient:
         print(f"     Total: {data['memory_total_gb']:.1f}G | Used: {data['memory_used_gb']:.1f}G")
         print(f"  💾 Disk Usage:    {data['disk']:>6.1f}%  {'█' * int(data['disk'] / 2)}")
         print(f"     Total: {data['disk_total_gb']:.1f}G | Used: {data['disk_used_gb']:.1f}G")
+        if data.get('sampling_mode'):
+            print(f"  ⏱️ Sampling:      {data['sampling_mode']} ({data['sample_interval']}s)")
         print()
         
         # Top CPU processes
@@ -117,4 +136,12 @@ class MonitoringClient:
 
 if __name__ == "__main__":
     client = MonitoringClient()
-    client.run()
\ No newline at end of file
+    
+    # python3 socket_client.py pid <PID> [field ...]
+    if len(sys.argv) >= 3 and sys.argv[1] == 'pid':
+        if client.connect():
+            details = client.request_pid_details(int(sys.argv[2]), sys.argv[3:] or None)
+            print(json.dumps(details, indent=2, ensure_ascii=False))
+            client.disconnect()
+    else:
+        client.run()
\ No newline at end of file
@@ -9,25 +9,58 @@ import json
 import threading
 import logging
 import psutil
+import select
+import sys
 import time
 
+from adaptive_sampler import AdaptiveSampler
+from config import ConfigManager
+from logging_config import dropped_log_records
+from parallel_scanner import ParallelProcessScanner, list_pids
+from pid_inspector import ALL_FIELDS, PidInspector
+from process_records import ProcessTable, current_rss_bytes
+from watchlist import Watchlist
+
 class MonitoringSocketServer:
-    def __init__(self, socket_path='/tmp/monitor.sock'):
+    def __init__(self, socket_path='/tmp/monitor.sock', parallel_threshold=5000, scan_workers=None,
+                 config_file='config.json'):
         self.socket_path = socket_path
         self.server_socket = None
         self.running = False
         self.clients = []
         self.lock = threading.Lock()
         
+        # Thresholds va sampling sozlamalari
+        self.config = ConfigManager(config_file)
+        self.sampler = AdaptiveSampler()
+        
+        # Katta hostlar uchun parallel /proc skaner
+        self.scanner = ParallelProcessScanner(workers=scan_workers, threshold=parallel_threshold)
+        
+        # PID drill-down (TTL kesh bilan)
+        self.inspector = PidInspector()
+        
+        # Ixcham process yozuvlari - sikldan siklga qayta ishlatiladi
+        self.process_table = ProcessTable()
+        self.last_allocated_blocks = sys.getallocatedblocks()
+        
+        # Process bo'yicha qoidalar (config.json 'watchlist')
+        self.watchlist = Watchlist()
+        
+        # Client handler'larni yangi o'lchov haqida uyg'otish (pipe write fd'lari)
+        self.wakeups = set()
+        
         # Monitoring data
-        self.current_metrics = {
+        self.current_metrics = None
+        self.current_payload = None
+        self._publish({
             'cpu': 0,
             'memory': 0,
             'disk': 0,
             'top_cpu_processes': [],
             'top_memory_processes': [],
             'timestamp': 0
-        }
+        })
         
     def start(self):
         """Server boshlash"""
@@ -57,6 +90,7 @@ class MonitoringSocketServer:
     def stop(self):
         """Server to'xtatish"""
         self.running = False
+        self._wake_clients()
         
         # Barcha clientlarni yopish
         with self.lock:
@@ -67,6 +101,9 @@ class MonitoringSocketServer:
                     pass
             self.clients.clear()
         
+        # Parallel scanner worker'larini yopish
+        self.scanner.close()
+        
         # Socket yopish
         if self.server_socket:
             self.server_socket.close()
@@ -99,52 +136,170 @@ class MonitoringSocketServer:
                 if self.running:
                     logging.error(f"Client qabul qilishda xato: {e}")
     
+    def _publish(self, metrics):
+        """Yangi o'lchov: bir marta serializatsiya, barcha client'larni uyg'otish"""
+        self.current_payload = (json.dumps(metrics) + '\n').encode('utf-8')
+        self.current_metrics = metrics
+        self._wake_clients()
+    
+    def _wake_clients(self):
+        # Lock ichida - handler fd'ni yopib bo'lgan bo'lsa, u allaqachon to'plamda yo'q
+        with self.lock:
+            for fd in self.wakeups:
+                try:
+                    os.write(fd, b'\0')
+                except OSError:
+                    pass  # pipe to'la - client baribir uyg'onadi
+    
     def _handle_client(self, client_socket):
         """Client bilan ishlash"""
+        wake_read, wake_write = os.pipe()
+        os.set_blocking(wake_read, False)
+        os.set_blocking(wake_write, False)
+        with self.lock:
+            self.wakeups.add(wake_write)
+        
+        # poll - select() 1024 dan katta fd'larda ishlamaydi (yuzlab client'da)
+        poller = select.poll()
+        poller.register(client_socket, select.POLLIN)
+        poller.register(wake_read, select.POLLIN)
+        client_fd = client_socket.fileno()
+        
         try:
+            buffer = b""
+            sent = None
             while self.running:
-                # Ma'lumot yuborish
-                data = json.dumps(self.current_metrics) + '\n'
-                client_socket.sendall(data.encode('utf-8'))
-                time.sleep(1)  # Har sekundda yangilanish
+                # Faqat yangi o'lchov yuboriladi - idle rejimda sampler har 2-10s da
+                # o'lchaydi, bir xil namunani qayta yuborish consumer'larni chalg'itadi
+                payload = self.current_payload
+                if payload is not sent:
+                    client_socket.sendall(payload)
+                    sent = payload
+                
+                # Yangi o'lchov (pipe) yoki client so'rovini kutish
+                events = dict(poller.poll(1000))
+                if wake_read in events:
+                    os.read(wake_read, 4096)
+                if client_fd not in events:
+                    continue
+                
+                chunk = client_socket.recv(4096)
+                if not chunk:
+                    logging.info("Client uzildi")
+                    return
+                
+                buffer += chunk
+                while b'\n' in buffer:
+                    line, buffer = buffer.split(b'\n', 1)
+                    self._handle_request(client_socket, line)
                 
         except (BrokenPipeError, ConnectionResetError):
             logging.info("Client uzildi")
         except Exception as e:
-            logging.error(f"Client bilan ishlashda xato: {e}")
+            # stop() socketni yopgan bo'lsa - xato emas
+            if self.running:
+                logging.error(f"Client bilan ishlashda xato: {e}")
         finally:
             with self.lock:
+                self.wakeups.discard(wake_write)
                 if client_socket in self.clients:
                     self.clients.remove(client_socket)
+            os.close(wake_read)
+            os.close(wake_write)
             try:
                 client_socket.close()
             except:
                 pass
     
+    def _handle_request(self, client_socket, line):
+        """Client so'rovini bajarish (request/response)"""
+        try:
+            request = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            request = None
+        
+        # Noto'g'ri so'rov faqat xato javobi - metrika oqimi uzilmaydi
+        if not isinstance(request, dict):
+            response = {'type': 'error', 'error': "So'rov JSON obyekt bo'lishi kerak"}
+        elif request.get('cmd') == 'pid_details':
+            response = self._pid_details(request)
+        else:
+            response = {'type': 'error', 'error': f"Noma'lum buyruq: {request.get('cmd')}"}
+        
+        client_socket.sendall((json.dumps(response) + '\n').encode('utf-8'))
+    
+    def _pid_details(self, request):
+        """pid_details so'rovini tekshirish va bajarish"""
+        pid = request.get('pid')
+        if isinstance(pid, bool) or not isinstance(pid, int) or pid <= 0:
+            return {'type': 'error', 'error': "pid noto'g'ri: musbat butun son kerak"}
+        
+        fields = request.get('fields')
+        if fields is not None:
+            if not isinstance(fields, list) or not all(isinstance(f, str) for f in fields):
+                return {'type': 'error', 'error': "fields satrlar ro'yxati bo'lishi kerak"}
+            unknown = [f for f in fields if f not in ALL_FIELDS]
+            if unknown:
+                return {'type': 'error', 'error': f"Noma'lum maydonlar: {', '.join(unknown)}"}
+        
+        return {'type': 'pid_details', 'details': self.inspector.inspect(pid, fields)}
+    
     def _monitor_loop(self):
         """Monitoring sikli"""
         # Minimal logging - har 60 sekundda bir marta
         last_log_time = 0
+        last_config_time = 0
+        processes = {
+            'top_cpu_processes': [],
+            'top_memory_processes': [],
+            'top_process_groups': [],
+            'watchlist_violations': [],
+            'scan_mode': None,
+            'process_count': 0,
+            'processes_timestamp': None
+        }
+        
+        # Birinchi chaqiruv - keyingi o'lchovlar uchun boshlang'ich nuqta
+        psutil.cpu_percent(interval=None)
         
         while self.running:
             try:
-                # CPU
-                cpu_percent = psutil.cpu_percent(interval=1)
+                # Config (thresholds, sampling) - har 30 sekundda qayta yuklash
+                if time.time() - last_config_time > 30:
+                    self.config.reload_config()
+                    self.sampler.configure(self.config.get('sampling', {}))
+                    self.watchlist.configure(self.config.get('watchlist', []))
+                    last_config_time = time.time()
+                
+                # Keyingi o'lchovgacha kutish - interval rejimga bog'liq
+                time.sleep(self.sampler.interval)
+                
+                # CPU (oldingi o'lchovdan beri - arzon)
+                cpu_percent = psutil.cpu_percent(interval=None)
                 
                 # Memory
                 memory = psutil.virtual_memory()
                 
                 # Disk
                 disk = psutil.disk_usage('/')
+                disks = self._get_disks()
                 
-                # Top CPU processes
-                top_cpu = self._get_top_cpu_processes(5)
+                # Sampling rejimi
+                mode = self.sampler.update(
+                    {'cpu': cpu_percent, 'memory': memory.percent, 'disk': disk.percent},
+                    self.config.get('thresholds', {})
+                )
                 
-                # Top Memory processes
-                top_memory = self._get_top_memory_processes(5)
+                # To'liq process skanerlash - faol rejimda har safar, tinch paytda kamdan-kam
+                if self.sampler.should_scan_processes():
+                    processes = self._scan_processes()
+                    # Watchlist buzilishi davom etayotganini kuzatish uchun faol rejimda qolamiz
+                    if processes['watchlist_violations']:
+                        self.sampler.hold_active()
+                        mode = self.sampler.mode
                 
                 # Ma'lumotlarni yangilash
-                self.current_metrics = {
+                self._publish({
                     'cpu': round(cpu_percent, 1),
                     'memory': round(memory.percent, 1),
                     'disk': round(disk.percent, 1),
@@ -152,64 +307,122 @@ class MonitoringSocketServer:
                     'memory_used_gb': round(memory.used / (1024**3), 1),
                     'disk_total_gb': round(disk.total / (1024**3), 1),
                     'disk_used_gb': round(disk.used / (1024**3), 1),
-                    'top_cpu_processes': top_cpu,
-                    'top_memory_processes': top_memory,
+                    'disks': disks,
+                    **processes,
+                    'sampling_mode': mode,
+                    'sample_interval': self.sampler.interval,
+                    'server_stats': self._collect_server_stats(),
                     'timestamp': time.time()
-                }
+                })
                 
                 # Har 60 sekundda bir marta log
                 current_time = time.time()
                 if current_time - last_log_time > 60:
-                    logging.info(f"📊 CPU: {cpu_percent:.1f}% | RAM: {memory.percent:.1f}% | Disk: {disk.percent:.1f}% | Clients: {len(self.clients)}")
+                    logging.info(
+                        f"📊 CPU: {cpu_percent:.1f}% | RAM: {memory.percent:.1f}% | Disk: {disk.percent:.1f}% | Clients: {len(self.clients)} | Mode: {mode}",
+                        extra={'metrics': {'cpu': cpu_percent, 'memory': memory.percent, 'disk': disk.percent}}
+                    )
                     last_log_time = current_time
                 
             except Exception as e:
                 logging.error(f"Monitoring xatosi: {e}")
                 time.sleep(1)
     
-    def _get_top_cpu_processes(self, limit=5):
-        """Top CPU processes"""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-            try:
-                proc.cpu_percent(interval=0.1)
-            except:
-                pass
-        
-        time.sleep(0.5)
-        
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
+    def _get_disks(self):
+        """Har bir mount bo'yicha disk (baytlarda - trend uchun aniqlik kerak)"""
+        disks = []
+        seen = set()
+        for part in psutil.disk_partitions(all=False):
+            if part.mountpoint in seen or part.fstype in ('squashfs', 'iso9660'):
+                continue
+            seen.add(part.mountpoint)
             try:
-                pinfo = proc.info
-                if pinfo['cpu_percent'] and pinfo['cpu_percent'] > 0:
-                    processes.append({
-                        'pid': pinfo['pid'],
-                        'name': pinfo['name'],
-                        'cpu': round(pinfo['cpu_percent'], 1)
-                    })
-            except:
-                pass
+                usage = psutil.disk_usage(part.mountpoint)
+            except (PermissionError, OSError):
+                continue
+            disks.append({
+                'mount': part.mountpoint,
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': round(usage.percent, 1)
+            })
+        return disks
+    
+    def _scan_processes(self):
+        """Top processlar - process soni katta bo'lsa parallel skanerlash"""
+        pids = list_pids()
+        top_groups = []
+        if self.scanner.should_use(len(pids)):
+            scan_mode = 'parallel'
+            result = self.scanner.scan(pids, limit=5, rules=self.watchlist.rules)
+            top_cpu = result['top_cpu']
+            top_memory = result['top_memory']
+            top_groups = result['groups']
+            violations = result['watchlist_violations']
+        else:
+            scan_mode = 'serial'
+            self.process_table.scan(pids)
+            
+            # Top CPU processes
+            top_cpu = self._get_top_cpu_processes(5)
+            
+            # Top Memory processes
+            top_memory = self._get_top_memory_processes(5)
+            
+            # Watchlist - top-N dan tashqaridagi processlar ham tekshiriladi
+            violations = self.watchlist.evaluate(
+                (r.pid, r.start_time, r.name, r.cpu, r.memory_mb)
+                for r in self.process_table.records.values()
+            )
         
-        return sorted(processes, key=lambda x: x['cpu'], reverse=True)[:limit]
+        return {
+            'top_cpu_processes': top_cpu,
+            'top_memory_processes': top_memory,
+            'top_process_groups': top_groups,
+            'watchlist_violations': violations,
+            'scan_mode': scan_mode,
+            'process_count': len(pids),
+            # Tinch rejimda processlar qayta yuboriladi - ular qachon o'lchangani
+            'processes_timestamp': time.time()
+        }
+    
+    def _get_top_cpu_processes(self, limit=5):
+        """Top CPU processes"""
+        return [
+            {'pid': r.pid, 'name': r.name, 'cpu': round(r.cpu, 1)}
+            for r in self.process_table.top('cpu', limit)
+        ]
     
     def _get_top_memory_processes(self, limit=5):
         """Top Memory processes"""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-            try:
-                pinfo = proc.info
-                mem_info = pinfo.get('memory_info')
-                if mem_info:
-                    mem_mb = mem_info.rss / (1024 * 1024)
-                    processes.append({
-                        'pid': pinfo['pid'],
-                        'name': pinfo['name'],
-                        'memory_mb': round(mem_mb, 1)
-                    })
-            except:
-                pass
+        return [
+            {'pid': r.pid, 'name': r.name, 'memory_mb': round(r.memory_mb, 1)}
+            for r in self.process_table.top('memory_mb', limit)
+        ]
+    
+    def _collect_server_stats(self):
+        """
+        Server o'z xotirasi: RSS, allocated block'lar, yozuvlar soni
+
+        allocated_blocks_delta - ikki sikl orasidagi tirik block'lar sonining
+        sof o'zgarishi (barcha thread'lar bo'yicha). Bu allokatsiyalar soni emas:
+        yaratilib bo'shatilgan obyektlar ko'rinmaydi, musbat qiymat doimiy
+        qolsa - sizib chiqish belgisi.
+        """
+        blocks = sys.getallocatedblocks()
+        delta = blocks - self.last_allocated_blocks
+        self.last_allocated_blocks = blocks
         
-        return sorted(processes, key=lambda x: x['memory_mb'], reverse=True)[:limit]
+        return {
+            'rss_mb': round(current_rss_bytes() / (1024 * 1024), 1),
+            'allocated_blocks': blocks,
+            'allocated_blocks_delta': delta,
+            'process_records': len(self.process_table.records),
+            'evicted_last_cycle': self.process_table.evicted_last,
+            'evicted_total': self.process_table.evicted_total,
+            'log_records_dropped': dropped_log_records()
+        }
 
 
 if __name__ == "__main__":
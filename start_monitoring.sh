@@ -19,14 +19,14 @@ else
     echo "⚠️  Virtual environment topilmadi, yaratilmoqda..."
     python3 -m venv venv
     source venv/bin/activate
-    pip install psutil requests
+    pip install psutil requests numpy
 fi
 
 echo ""
 echo "📦 Dependencies tekshirilmoqda..."
 python3 -c "import psutil, requests" 2>/dev/null || {
     echo "⚠️  Dependencies o'rnatilmoqda..."
-    pip install psutil requests
+    pip install psutil requests numpy
 }
 
 echo ""
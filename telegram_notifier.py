@@ -2,10 +2,11 @@ import requests
 import logging
 
 class TelegramNotifier:
-    def __init__(self, bot_token, chat_id):
+    def __init__(self, bot_token, chat_id, api_url='https://api.telegram.org', timeout=10):
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        self.timeout = timeout
+        self.url = f"{api_url.rstrip('/')}/bot{bot_token}/sendMessage"
     
     def send_message(self, message):
         """Telegram orqali xabar yuborish"""
@@ -16,7 +17,7 @@ class TelegramNotifier:
         }
         
         try:
-            response = requests.post(self.url, data=data, timeout=10)
+            response = requests.post(self.url, data=data, timeout=self.timeout)
             if response.status_code == 200:
                 logging.info("✅ Telegram xabar yuborildi")
                 return True
@@ -34,26 +35,38 @@ class TelegramNotifier:
     
     def _format_alert(self, data):
         """Alert formatlash"""
-        message = "┌────────────────────────────────────────────┐\n"
-        message += f"│         {data['emoji']} {data['title']:<30}│\n"
-        message += "├────────────────────────────────────────────┤\n"
-        message += f"│🗓️ Date: {data['date']:<30}.       │\n"
-        message += f"│🖥️ Hostname: {data['hostname']:<30}│\n"
-        message += f"│🌐 IP Address: {data['ip']:<28}.   │\n"
-        message += f"│⏳ Uptime: {data['uptime']:<32}.   │\n"
-        message += "├────────────────────────────────────────────┤\n"
-        
-        # Metrika ma'lumotlari
-        for line in data['metrics']:
-            message += f"│{line:<44}│\n"
-        
+        return format_alert(data)
+
+
+def format_alert(data):
+    """Alert formatlash (barcha kanallar uchun umumiy box ko'rinish)"""
+    message = "┌────────────────────────────────────────────┐\n"
+    message += f"│         {data['emoji']} {data['title']:<30}│\n"
+    message += "├────────────────────────────────────────────┤\n"
+    message += f"│🗓️ Date: {data['date']:<30}.       │\n"
+    message += f"│🖥️ Hostname: {data['hostname']:<30}│\n"
+    message += f"│🌐 IP Address: {data['ip']:<28}.   │\n"
+    message += f"│⏳ Uptime: {data['uptime']:<32}.   │\n"
+    message += "├────────────────────────────────────────────┤\n"
+    
+    # Metrika ma'lumotlari
+    for line in data['metrics']:
+        message += f"│{line:<44}│\n"
+    
+    message += "├────────────────────────────────────────────┤\n"
+    
+    # Top processes
+    if data.get('processes'):
+        message += f"│📊 {data['process_title']:<42}│\n"
+        for proc in data['processes']:
+            message += f"│  {proc:<42}│\n"
+    
+    # Drill-down (ixtiyoriy)
+    if data.get('details'):
         message += "├────────────────────────────────────────────┤\n"
-        
-        # Top processes
-        if 'processes' in data:
-            message += f"│📊 {data['process_title']:<42}│\n"
-            for proc in data['processes']:
-                message += f"│  {proc:<42}│\n"
-        
-        message += "└────────────────────────────────────────────┘"
-        return message
\ No newline at end of file
+        message += f"│{data['details_title']:<44}│\n"
+        for line in data['details']:
+            message += f"│  {line:<42}│\n"
+    
+    message += "└────────────────────────────────────────────┘"
+    return message
\ No newline at end of file
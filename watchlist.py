@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Watchlist - process bo'yicha qoidalar ("postgres RSS > 20G", "java CPU > 400%")
+
+Barcha patternlar bitta regex'ga kompilyatsiya qilinadi; natija
+(pid, start_time) bo'yicha keshlanadi - har bir process uchun bitta lookup.
+"""
+
+import logging
+import re
+
+METRICS = ('cpu', 'memory_mb')
+
+# Har bir qoida bo'yicha oqimga yuboriladigan maksimal processlar
+MAX_VIOLATIONS_PER_RULE = 5
+
+
+def read_cmdline(proc_root, pid):
+    """/proc/<pid>/cmdline (argumentlar bo'sh joy bilan)"""
+    try:
+        with open(f'{proc_root}/{pid}/cmdline', 'rb') as f:
+            data = f.read()
+    except OSError:
+        return ''
+    return data.replace(b'\0', b' ').replace(b'\n', b' ').decode('utf-8', 'replace').strip()
+
+
+# Pattern boshidagi global flaglar: (?i)java
+_GLOBAL_FLAGS = re.compile(r'\A\(\?([aiLmsux]+)\)')
+
+# Nomli guruh va backreference - birlashtirilgan regex'da nomlar to'qnashadi,
+# raqamli guruhlar esa siljiydi
+_GROUP_REFERENCES = re.compile(r'\(\?P[<=]|\(\?\(|\\[1-9]|\\g<')
+
+
+def _scoped_pattern(pattern):
+    """Foydalanuvchi patternini birlashtirilgan regex'ga qo'yish mumkin bo'lgan shaklga keltirish"""
+    re.compile(pattern, re.MULTILINE)
+    if _GROUP_REFERENCES.search(pattern):
+        raise ValueError("nomli guruh va backreference qo'llab-quvvatlanmaydi")
+
+    # (?i)java -> (?i:java)
+    flags = _GLOBAL_FLAGS.match(pattern)
+    if flags:
+        # verbose rejimda '#' izoh qator oxirigacha - yopuvchi qavsdan oldin yangi qator
+        end = '\n' if 'x' in flags.group(1) else ''
+        return f"(?{flags.group(1)}:{pattern[flags.end():]}{end})"
+    return pattern
+
+
+class Watchlist:
+    def __init__(self, rules=None):
+        self.rules = []
+        self.matcher = None
+        self.uses_cmdline = False
+        self.cache = {}
+        self.next_cache = {}
+        # Oxirgi o'tishda keshda topilmagan processlar (cmdline o'qish + regex)
+        self.misses = 0
+        self.configure(rules or [])
+
+    def configure(self, rules):
+        """Qoidalarni yuklash - o'zgargan bo'lsa qayta kompilyatsiya"""
+        rules = [r for r in rules if r.get('metric') in METRICS and 'match' in r]
+        if rules == self.rules:
+            return
+
+        # Avval kompilyatsiya - xato bo'lsa eski holat buzilmasin
+        matcher = self._compile(rules) if rules else None
+
+        self.rules = rules
+        self.matcher = matcher
+        self.cache = {}
+        self.next_cache = {}
+        self.uses_cmdline = any(r.get('field') == 'cmdline' for r in rules)
+
+    @staticmethod
+    def _compile(rules):
+        """
+        Nishon: nom va cmdline (yangi qator bilan). Har bir qoida -
+        ixtiyoriy lookahead, shuning uchun bitta match() barcha mos qoidalarni topadi.
+        Birlashtirib bo'lmaydigan pattern o'chiriladi (hech narsaga mos kelmaydi).
+        """
+        parts = []
+        for i, rule in enumerate(rules):
+            try:
+                pattern = _scoped_pattern(rule['match'])
+                if rule.get('field') == 'cmdline':
+                    part = f"(?:(?=.*\\n.*?(?P<r{i}>{pattern})))?"
+                else:
+                    part = f"(?:(?=.*?(?P<r{i}>{pattern})))?"
+                re.compile(part, re.MULTILINE)
+            except (re.error, ValueError) as e:
+                logging.error(f"❌ Watchlist pattern xato ({rule.get('name', i)}): {e}")
+                part = f"(?P<r{i}>(?!))?"
+            parts.append(part)
+        return re.compile(r'\A' + ''.join(parts), re.MULTILINE)
+
+    def begin_pass(self):
+        """Yangi skan o'tishi - faqat shu o'tishda ko'ringan PID'lar keshda qoladi"""
+        self.next_cache = {}
+        self.misses = 0
+
+    def end_pass(self):
+        self.cache = self.next_cache
+
+    def match(self, pid, start_time, name, proc_root='/proc'):
+        """Process'ga mos qoidalar indekslari (keshlangan)"""
+        key = (pid, start_time)
+        rules = self.cache.get(key)
+        if rules is None:
+            self.misses += 1
+            cmdline = read_cmdline(proc_root, pid) if self.uses_cmdline else ''
+            found = self.matcher.match(f"{name}\n{cmdline}")
+            rules = tuple(
+                i for i in range(len(self.rules))
+                if found.group(f'r{i}') is not None
+            )
+        self.next_cache[key] = rules
+        return rules
+
+    def evaluate(self, processes, proc_root='/proc'):
+        """
+        processes: (pid, start_time, name, cpu, memory_mb) ketma-ketligi
+
+        Threshold'dan oshgan processlar ro'yxatini qaytaradi.
+        """
+        if self.matcher is None:
+            return []
+
+        self.begin_pass()
+        violations = []
+        for pid, start_time, name, cpu, memory_mb in processes:
+            rules = self.match(pid, start_time, name, proc_root)
+            for i in rules:
+                rule = self.rules[i]
+                value = cpu if rule['metric'] == 'cpu' else memory_mb
+                if value > rule['threshold']:
+                    violations.append({
+                        'rule': rule.get('name', rule['match']),
+                        'pid': pid,
+                        'name': name,
+                        'metric': rule['metric'],
+                        'value': round(value, 1),
+                        'threshold': rule['threshold']
+                    })
+        self.end_pass()
+
+        return self.limit(violations)
+
+    @staticmethod
+    def limit(violations):
+        """Har bir qoida bo'yicha eng katta qiymatli processlar"""
+        violations.sort(key=lambda v: v['value'], reverse=True)
+        counts = {}
+        limited = []
+        for violation in violations:
+            count = counts.get(violation['rule'], 0)
+            if count < MAX_VIOLATIONS_PER_RULE:
+                counts[violation['rule']] = count + 1
+                limited.append(violation)
+        return limited